@@ -1,18 +1,143 @@
 import argparse
+import json
 import os
+import shutil
 import sys
+import tarfile
 import tempfile
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Optional
 
 import requests
+import urllib3
 from colorama import Fore, Style
+from requests.adapters import HTTPAdapter
 
 TEMPLATES_REPO = "pyfenn/fenn"
-REPO_NAME = "fenn"
 TEMPLATES_DIR = "templates"
 GITHUB_API_BASE = "https://api.github.com"
 GITHUB_ARCHIVE_BASE = "https://github.com"
+EXTRACT_WORKERS = 16
+COPY_BUFFER_SIZE = 1 << 16
+STREAM_THRESHOLD = 1 << 20
+SPOOL_MAX_SIZE = 32 << 20
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "fenn"
+ETAG_CACHE_FILE = "github_etag.json"
+ARCHIVE_CACHE_SIZE = 3
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the HTTP session shared by all GitHub requests of the command.
+
+    Reusing one session keeps the TLS connection to GitHub alive between the
+    API and archive requests. Transient gateway errors are retried, and
+    GITHUB_TOKEN, when set, raises the API rate limit from 60 to 5000
+    requests per hour.
+    """
+    session = requests.Session()
+    retries = urllib3.Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries),
+    )
+    session.headers["User-Agent"] = "fenn-cli"
+
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+
+    return session
+
+
+_SESSION = _build_session()
+
+def _load_etag_cache() -> dict:
+    """Load the {url: {"etag", "body"}} cache, or an empty one if unreadable."""
+    try:
+        with open(CACHE_DIR / ETAG_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_etag_cache(cache: dict) -> None:
+    """Atomically persist the ETag cache, ignoring an unwritable cache dir."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A name of its own, so concurrent pulls do not write the same file
+        tmp_file = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=CACHE_DIR, suffix=".tmp", delete=False
+        )
+    except OSError:
+        return
+
+    try:
+        with tmp_file:
+            json.dump(cache, tmp_file)
+        os.replace(tmp_file.name, CACHE_DIR / ETAG_CACHE_FILE)
+    except OSError:
+        pass
+    finally:
+        Path(tmp_file.name).unlink(missing_ok=True)
+
+
+def _get_cached(url: str, timeout: int, accept: Optional[str] = None) -> str:
+    """
+    GET a GitHub API URL and return its body, revalidating with ETags.
+
+    A previously seen response is sent back as If-None-Match; GitHub answers
+    304 without a body (and without charging the rate limit) when nothing
+    changed, in which case the cached body is used.
+
+    Args:
+        url: GitHub API URL to fetch
+        timeout: Request timeout in seconds
+        accept: Media type to request instead of the default JSON
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    # Each representation has its own ETag
+    key = f"{accept} {url}" if accept else url
+    cache = _load_etag_cache()
+    entry = cache.get(key)
+    headers = {"If-None-Match": entry["etag"]} if entry else {}
+    if accept:
+        headers["Accept"] = accept
+
+    response = _SESSION.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and entry:
+        return entry["body"]
+    response.raise_for_status()
+
+    etag = response.headers.get("ETag")
+    if etag:
+        cache[key] = {"etag": etag, "body": response.text}
+        _save_etag_cache(cache)
+
+    return response.text
+
+
+def _get_json_cached(url: str, timeout: int):
+    """
+    GET a GitHub API URL and decode its JSON body, see _get_cached.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    body = _get_cached(url, timeout)
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON from {url}: {e}") from e
+
 
 def execute(args: argparse.Namespace) -> None:
     """
@@ -82,73 +207,215 @@ def _download_template(template_name: str, target_dir: Path, force: bool) -> Non
     Raises:
         TemplateNotFoundError: If template doesn't exist
         NetworkError: If network request fails
-        TemplateError: If template structure is invalid
+        TemplateError: If the template archive cannot be extracted
     """
-    # Check if template exists using GitHub API
-    template_path = f"repos/{TEMPLATES_REPO}/contents/{TEMPLATES_DIR}/{template_name}"
-    api_url = f"{GITHUB_API_BASE}/{template_path}"
+    # Resolve the current commit so the archive can be cached per revision
+    commit_url = f"{GITHUB_API_BASE}/repos/{TEMPLATES_REPO}/commits/main"
 
     try:
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 404:
-            raise TemplateNotFoundError(
-                f"Template {Fore.LIGHTYELLOW_EX}{template_name}{Fore.RED} not found. "
-                f"Use {Fore.LIGHTYELLOW_EX}fenn pull --list{Fore.RED} to see available templates, "
-                f"or visit {Fore.CYAN}https://github.com/{TEMPLATES_REPO}{Style.RESET_ALL}"
-            )
-        raise NetworkError(f"Failed to check template existence: {e}")
+        # Only the SHA, rather than the whole commit with its file patches
+        sha = _get_cached(commit_url, timeout=10, accept="application/vnd.github.sha").strip()
     except requests.exceptions.RequestException as e:
-        raise NetworkError(f"Network request failed: {e}")
-
-    # Download the template as a zip archive
-    archive_url = f"{GITHUB_ARCHIVE_BASE}/{TEMPLATES_REPO}/archive/refs/heads/main.zip"
+        raise NetworkError(f"Failed to resolve latest templates revision: {e}")
 
     try:
-        response = requests.get(archive_url, timeout=30, stream=True)
-        response.raise_for_status()
+        with _open_archive(sha) as archive:
+            found = _extract_template(archive, template_name, target_dir)
     except requests.exceptions.RequestException as e:
         raise NetworkError(f"Failed to download template archive: {e}")
+    except tarfile.TarError as e:
+        # Don't let a corrupt archive break every following pull
+        _archive_path(sha).unlink(missing_ok=True)
+        raise TemplateError(f"Failed to extract template archive: {e}")
+    except urllib3.exceptions.HTTPError as e:
+        raise NetworkError(f"Failed to download template archive: {e}")
+
+    # The archive doubles as the existence check: a template with no
+    # entries under its prefix does not exist
+    if not found:
+        raise TemplateNotFoundError(
+            f"Template {Fore.LIGHTYELLOW_EX}{template_name}{Fore.RED} not found. "
+            f"Use {Fore.LIGHTYELLOW_EX}fenn pull --list{Fore.RED} to see available templates, "
+            f"or visit {Fore.CYAN}https://github.com/{TEMPLATES_REPO}{Style.RESET_ALL}"
+        )
+
+
+def _open_archive(sha: str) -> BinaryIO:
+    """
+    Open the gzipped tarball of the repository at the given commit.
 
-    # Extract only the specific template directory from the archive
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
+    Archives are cached in CACHE_DIR, so pulling again from an unchanged
+    repository does not download anything. Only the ARCHIVE_CACHE_SIZE most
+    recently used archives are kept. A fresh download is held in memory up
+    to SPOOL_MAX_SIZE and extracted from there, the cached copy is only
+    written for the next pull.
+
+    Args:
+        sha: Commit SHA of the repository revision
+
+    Returns:
+        Binary file object positioned at the start of the archive
+
+    Raises:
+        requests.exceptions.RequestException: If the download fails
+    """
+    archive_path = _archive_path(sha)
+    try:
+        archive = open(archive_path, "rb")
+    except OSError:
+        # Not cached, or not readable: download it
+        pass
+    else:
+        try:
+            # Refresh the mtime, which the eviction uses as last-access time
+            os.utime(archive_path)
+        except OSError:
+            # Shared cache owned by another user, or evicted meanwhile
+            pass
+        return archive
+
+    archive_url = f"{GITHUB_ARCHIVE_BASE}/{TEMPLATES_REPO}/archive/{sha}.tar.gz"
+    response = _SESSION.get(archive_url, timeout=30, stream=True)
+    response.raise_for_status()
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    try:
+        for chunk in response.iter_content(chunk_size=COPY_BUFFER_SIZE):
+            spool.write(chunk)
+        _cache_archive(spool, archive_path)
+    except BaseException:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return spool
+
+
+def _archive_path(sha: str) -> Path:
+    """Path of the cached archive of the given commit."""
+    return CACHE_DIR / f"templates-{sha}.tar.gz"
+
+
+def _cache_archive(spool: BinaryIO, archive_path: Path) -> None:
+    """
+    Store a downloaded archive in CACHE_DIR, if the cache is writable.
+
+    Args:
+        spool: Binary file object holding the whole archive
+        archive_path: Path of the archive in the cache
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A name of its own, so concurrent pulls do not write the same file
+        part_file = tempfile.NamedTemporaryFile(
+            dir=CACHE_DIR, prefix=f"{archive_path.name}.", suffix=".part", delete=False
+        )
+    except OSError:
+        # No usable cache directory, the archive is only used this time
+        return
+
+    part_path = Path(part_file.name)
+    try:
+        with part_file:
+            spool.seek(0)
+            shutil.copyfileobj(spool, part_file, COPY_BUFFER_SIZE)
+        os.replace(part_path, archive_path)
+    except OSError:
+        return
+    finally:
+        part_path.unlink(missing_ok=True)
+
+    _evict_archives()
+
+
+def _evict_archives() -> None:
+    """Delete all but the ARCHIVE_CACHE_SIZE most recently used archives."""
+    archives = []
+    for path in CACHE_DIR.glob("templates-*.tar.gz"):
         try:
-            for chunk in response.iter_content(chunk_size=8192):
-                tmp_file.write(chunk)
-            tmp_file.flush()
-
-            with zipfile.ZipFile(tmp_file.name, 'r') as zip_ref:
-                # Find all files in the template directory
-                template_prefix = f"{REPO_NAME}-main/{TEMPLATES_DIR}/{template_name}/"
-                template_files = [
-                    f for f in zip_ref.namelist()
-                    if f.startswith(template_prefix)
-                ]
-
-                if not template_files:
-                    raise TemplateError(
-                        f"Template {Fore.LIGHTYELLOW_EX}{template_name}{Fore.RED} "
-                        f"appears to be empty or has an unexpected structure."
-                    )
-
-                target_dir.mkdir(parents=True, exist_ok=True)
-
-                # Extract files and dirs, removing the template prefix from paths
-                for file_path in template_files:
-                    relative_path = file_path[len(template_prefix):]
-                    if not relative_path:
-                        continue
-                    if file_path.endswith('/'):
-                        (target_dir / relative_path.rstrip('/')).mkdir(parents=True, exist_ok=True)
-                        continue
-                    dest_path = target_dir / relative_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    with zip_ref.open(file_path) as source:
-                        dest_path.write_bytes(source.read())
-        finally:
-            # Clean up temporary file
-            os.unlink(tmp_file.name)
+            archives.append((path.stat().st_mtime, path))
+        except OSError:
+            # Evicted by a concurrent pull
+            continue
+    archives.sort(reverse=True)
+
+    for _, stale in archives[ARCHIVE_CACHE_SIZE:]:
+        try:
+            stale.unlink(missing_ok=True)
+        except OSError:
+            # Not ours to delete in a shared cache
+            pass
+
+
+def _extract_template(archive: BinaryIO, template_name: str, target_dir: Path) -> bool:
+    """
+    Extract one template directory from a gzipped repository tarball.
+
+    The archive is read as a stream and only the entries under the template
+    directory are written to disk, everything else is skipped as it goes by.
+    GitHub archives list each directory's entries contiguously, so reading
+    stops as soon as the template directory has been passed.
+
+    Args:
+        archive: Binary file object of the repository tarball
+        template_name: Name of the template folder in the repository
+        target_dir: Directory where template should be extracted
+
+    Returns:
+        Whether the archive contained any entry of the template
+    """
+    # The top-level directory of the archive depends on the revision, so
+    # entries are matched on the path below it
+    template_prefix = f"{TEMPLATES_DIR}/{template_name}/"
+    prefix_length = len(template_prefix)
+    found = False
+
+    # Large files are copied through one buffer reused for every chunk
+    buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+
+    # The stream has to be read in order, so members are read here and
+    # the writes are handed off to the pool
+    with (
+        ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor,
+        tarfile.open(fileobj=archive, mode="r|gz") as tar_ref,
+    ):
+        writes = []
+        for member in tar_ref:
+            member_path = member.name.partition("/")[2]
+            if not member_path.startswith(template_prefix):
+                if found:
+                    # Past the template directory, the rest of the
+                    # archive does not need to be decompressed
+                    break
+                continue
+            found = True
+
+            # Extract files and dirs, removing the template prefix from paths
+            relative_path = member_path[prefix_length:]
+            if not relative_path:
+                continue
+            if member.isdir():
+                (target_dir / relative_path).mkdir(parents=True, exist_ok=True)
+                continue
+            if not member.isfile():
+                continue
+            dest_path = target_dir / relative_path
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            with tar_ref.extractfile(member) as source:
+                if member.size > STREAM_THRESHOLD:
+                    # Large files are piped through the buffer instead of
+                    # being held in memory for the pool
+                    with open(dest_path, "wb") as dest:
+                        while read := source.readinto(buffer):
+                            dest.write(buffer[:read])
+                else:
+                    writes.append(executor.submit(dest_path.write_bytes, source.read()))
+
+        # Surface the first failed write, if any
+        for write in writes:
+            write.result()
+
+    return found
 
 
 class TemplateNotFoundError(Exception):
@@ -176,13 +443,10 @@ def _list_templates() -> None:
     api_url = f"{GITHUB_API_BASE}/repos/{TEMPLATES_REPO}/contents/{TEMPLATES_DIR}"
 
     try:
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
+        contents = _get_json_cached(api_url, timeout=10)
     except requests.exceptions.RequestException as e:
         raise NetworkError(f"Failed to fetch template list: {e}")
 
-    contents = response.json()
-
     templates = [
         item["name"] for item in contents
         if item.get("type") == "dir"
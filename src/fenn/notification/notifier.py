@@ -1,16 +1,201 @@
-from typing import List, Type, Iterable
+import asyncio
+import logging
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Type, Iterable, Union
 from fenn.notification.service import Service
+from fenn.notification.services._session import async_client_session
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the services notified at the same time
+MAX_NOTIFY_WORKERS = 32
+
+# Upper bound on the queued messages a background worker takes at once
+MAX_BACKGROUND_BATCH = 64
+
+
+def _collect(outcomes: Iterable[Tuple[str, Optional[Exception]]]) -> None:
+    """Sort the outcomes of one notification and log a record per outcome kind.
+
+    Args:
+        outcomes: (name, exception) for each service as it finishes, with
+            None as exception when it succeeded. A service may appear once
+            per failure, it counts as successful only without any.
+    """
+    # Only built once there is something to put in them
+    successful_services = None
+    failed_services = None
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for name, error in outcomes:
+        if error is not None:
+            if failed_services is None:
+                failed_services = []
+            failed_services.append((name, error))
+        else:
+            if successful_services is None:
+                successful_services = []
+            successful_services.append(name)
+        if debug:
+            logger.debug("Notification via %s done: %s", name, error or "ok")
+
+    if successful_services:
+        logger.info(
+            "Notification sent via %d services: %s",
+            len(successful_services),
+            successful_services,
+        )
+    if failed_services:
+        logger.error(
+            "Failed to send notification via %d services: %s",
+            len(failed_services),
+            failed_services,
+        )
+
+
+def _send_all(service: Service, messages: List[str]) -> List[Exception]:
+    """Send messages through one service in order, carrying on after failures.
+
+    Args:
+        service: The service to send with.
+        messages: The messages to send.
+
+    Returns:
+        The exceptions raised by the messages that failed.
+    """
+    errors = []
+    for message in messages:
+        try:
+            service.send_notification(message)
+        except Exception as error:
+            errors.append(error)
+    return errors
+
+
+# Queued by close() to stop the background worker
+_STOP = object()
+
+
+def _drain(notifier_ref: weakref.ref, jobs: queue.SimpleQueue) -> None:
+    """Send queued messages, run by the background worker thread.
+
+    The worker only holds a weak reference to its notifier, so a notifier
+    that is no longer used can be collected, which stops the worker.
+
+    Args:
+        notifier_ref: Weak reference to the owning notifier.
+        jobs: The queue of messages to send.
+    """
+    while True:
+        # Take whatever piled up since the last round in one go
+        batch = [jobs.get()]
+        try:
+            while len(batch) < MAX_BACKGROUND_BATCH:
+                batch.append(jobs.get_nowait())
+        except queue.Empty:
+            pass
+
+        notifier = notifier_ref()
+        if notifier is None:
+            return
+
+        stop = _STOP in batch
+        messages = batch[:batch.index(_STOP)] if stop else batch
+        for message in messages:
+            try:
+                notifier._dispatch(message)
+            except Exception:
+                logger.exception("Failed to send background notification")
+
+        with notifier._idle:
+            # Messages behind the sentinel are dropped, but no longer pending
+            notifier._pending -= len(batch) - stop
+            if notifier._pending == 0:
+                notifier._idle.notify_all()
+
+        del notifier
+        if stop:
+            return
+
 
 class Notifier:
     """Central notification manager that handles multiple notification services."""
 
-    def __init__(self):
-        """Initialize the notifier with an empty list of services."""
+    def __init__(self, background: bool = False):
+        """Initialize the notifier with an empty list of services.
+
+        Args:
+            background: If True, notify only queues the message and returns
+                at once. A daemon thread sends the queued messages in order,
+                use flush to wait for them and close to stop it.
+        """
+        # Guards the services and the executor, which the background worker
+        # uses while the caller's thread may modify them
+        self._lock = threading.RLock()
         self._services: List[Service] = []
+        # Class names of the services, kept in step with self._services
+        self._names: List[str] = []
+        # Position of each registered instance in self._services, by id
+        self._index: Dict[int, int] = {}
+        # Ids of the registered instances of each service class, in order
+        self._ids: Dict[Type[Service], Dict[int, None]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._worker: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.SimpleQueue()
+            # Messages queued but not sent yet, guarded by self._idle
+            self._pending = 0
+            self._idle = threading.Condition()
+            self._worker = threading.Thread(
+                target=_drain,
+                args=(weakref.ref(self), self._queue),
+                name="fenn-notify-background",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def __del__(self):
+        if hasattr(self, "_lock"):
+            # Queued messages can no longer be sent, don't wait for them
+            self.close(timeout=0)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Stop the background worker and release the services and threads.
+
+        Messages queued in background mode are sent before the worker stops,
+        later calls to notify send synchronously. All services are removed
+        and closed afterwards.
+
+        Args:
+            timeout: Maximum time to wait for the worker in seconds, None
+                waits forever.
+
+        Returns:
+            Whether the background worker stopped before the timeout.
+        """
+        stopped = True
+        worker = self._worker
+        if worker is not None:
+            # Once the sentinel is queued, notify sends synchronously again
+            with self._idle:
+                jobs, self._queue = self._queue, None
+                if jobs is not None:
+                    jobs.put(_STOP)
+            if worker.is_alive() and worker is not threading.current_thread():
+                worker.join(timeout)
+                stopped = not worker.is_alive()
+
+        self.clear_services()
+        return stopped
 
     def add_services(
         self,
-        services: Iterable[Type[Service]],
+        services: Iterable[Union[Type[Service], Service]],
     ) -> None:
         """
         Add a list of notification services.
@@ -22,49 +207,186 @@ class Notifier:
         for service_cls in services:
             self.add_service(service_cls)
 
-    def add_service(self, service: Type[Service]) -> None:
+    def add_service(self, service: Union[Type[Service], Service]) -> None:
         """Add a notification service.
 
+        A class can be added several times, for example as instances with
+        different settings. Adding the same instance again is ignored with a
+        warning.
+
         Args:
-            service: A service implementing the Service interface.
+            service: A service implementing the Service interface, or an
+                already configured instance of one.
         """
-        self._services.append(service())
+        if isinstance(service, type):
+            service = service()
+        service_cls = service.__class__
+        with self._lock:
+            if id(service) in self._index:
+                logger.warning("Service %s is already registered", service_cls.__name__)
+                return
+            self._index[id(service)] = len(self._services)
+            self._ids.setdefault(service_cls, {})[id(service)] = None
+            self._services.append(service)
+            self._names.append(service_cls.__name__)
+        logger.debug("Added notification service: %s", service_cls.__name__)
 
-    def remove_service(self, service: Type[Service]) -> None:
+    def remove_service(self, service: Union[Type[Service], Service]) -> None:
         """Remove a notification service.
 
+        The last registered service takes the place of the removed one, so
+        removal takes constant time but does not preserve the order of the
+        services.
+
         Args:
-            service: The service to remove.
+            service: The instance to remove, or a class to remove all of its
+                instances.
 
         Raises:
             ValueError: If the service is not found.
         """
-        try:
-            self._services.remove(service())
-        except ValueError:
-            ValueError(f"Service {service.__class__.__name__} not found in services list")
-            raise
+        service_cls = service if isinstance(service, type) else service.__class__
+        with self._lock:
+            ids = self._ids.get(service_cls, {})
+            if isinstance(service, type):
+                removed_ids = list(ids)
+            else:
+                removed_ids = [id(service)] if id(service) in ids else []
+            if not removed_ids:
+                raise ValueError(f"Service {service_cls.__name__} not found in services list")
+
+            removed = []
+            for key in removed_ids:
+                del ids[key]
+                removed.append(self._remove_at(self._index.pop(key)))
+            if not ids:
+                del self._ids[service_cls]
+
+        for instance in removed:
+            instance.close()
+        logger.debug("Removed notification service: %s", service_cls.__name__)
 
     def notify(self, message: str) -> None:
         """Send notification to all registered services.
 
+        Services are notified concurrently on a thread pool kept by the
+        notifier, so the total latency is that of the slowest service rather
+        than the sum of all of them. A failing service does not prevent the
+        others from being notified. In background mode the message is only
+        queued.
+
         Args:
             message: The message to send.
         """
-        if not self._services:
+        if self._queue is not None:
+            with self._idle:
+                # Checked again under the lock, close may have stopped the worker
+                if self._queue is not None:
+                    self._pending += 1
+                    self._queue.put(message)
+                    return
+
+        self._dispatch(message)
+
+    def notify_many(self, messages: Iterable[str]) -> None:
+        """Send several messages to all registered services.
+
+        Services are notified concurrently, each one on a single worker that
+        sends the messages in order over its open connection. A failing
+        message does not prevent the following ones from being sent. In
+        background mode the messages are only queued.
+
+        Args:
+            messages: The messages to send.
+        """
+        messages = list(messages)
+        if self._queue is not None:
+            for message in messages:
+                self.notify(message)
             return
 
-        successful_services = []
-        failed_services = []
+        if not messages:
+            return
 
-        for service in self._services:
-            try:
-                service.send_notification(message)
-                successful_services.append(service.__class__.__name__)
-                #logger.info(f"Successfully sent notification via {service.__class__.__name__}")
-            except Exception as e:
-                failed_services.append((service.__class__.__name__, str(e)))
-                #logger.error(f"Failed to send notification via {service.__class__.__name__}: {e}")
+        # Submitted under the lock so the executor cannot be shut down by a
+        # concurrent clear_services in between
+        with self._lock:
+            if not self._services:
+                return
+            submit = self._get_executor().submit
+            futures = {
+                submit(_send_all, service, messages): name
+                for service, name in zip(self._services, self._names)
+            }
+
+        # One outcome per failed message, or a single success
+        _collect(
+            (futures[future], error)
+            for future in as_completed(futures)
+            for error in future.result() or [None]
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all messages queued in background mode are sent.
+
+        Args:
+            timeout: Maximum time to wait in seconds, None waits forever.
+
+        Returns:
+            Whether the queue was drained before the timeout.
+        """
+        if self._queue is None:
+            return True
+
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _dispatch(self, message: str) -> None:
+        """Send one message to all registered services and log the outcome.
+
+        Args:
+            message: The message to send.
+        """
+        # Submitted under the lock so the executor cannot be shut down by a
+        # concurrent clear_services in between
+        with self._lock:
+            if not self._services:
+                return
+            submit = self._get_executor().submit
+            futures = {
+                submit(service.send_notification, message): name
+                for service, name in zip(self._services, self._names)
+            }
+
+        _collect((futures[future], future.exception()) for future in as_completed(futures))
+
+    async def notify_async(self, message: str) -> None:
+        """Send notification to all registered services concurrently.
+
+        Total latency is that of the slowest service rather than the sum of
+        all of them. A failing service does not prevent the others from
+        being notified.
+
+        Args:
+            message: The message to send.
+        """
+        with self._lock:
+            services = list(self._services)
+            names = list(self._names)
+        if not services:
+            return
+
+        # The services that post with aiohttp share one session for the call
+        async with async_client_session():
+            results = await asyncio.gather(
+                *(service.send_notification_async(message) for service in services),
+                return_exceptions=True,
+            )
+
+        _collect(
+            (name, result if isinstance(result, Exception) else None)
+            for name, result in zip(names, results)
+        )
 
     def get_services(self) -> List[str]:
         """Get list of registered service names.
@@ -72,8 +394,56 @@ class Notifier:
         Returns:
             List of service class names.
         """
-        return [service.__class__.__name__ for service in self._services]
+        with self._lock:
+            return list(self._names)
 
     def clear_services(self) -> None:
         """Remove all registered services."""
-        self._services.clear()
\ No newline at end of file
+        with self._lock:
+            services = list(self._services)
+            self._services.clear()
+            self._names.clear()
+            self._index.clear()
+            self._ids.clear()
+            self._shutdown_executor()
+        for service in services:
+            service.close()
+        logger.debug("Removed all notification services")
+
+    def _remove_at(self, index: int) -> Service:
+        """Remove the service at index by moving the last one into its place.
+
+        Must be called with self._lock held.
+
+        Args:
+            index: Position of the service in self._services.
+
+        Returns:
+            The removed service.
+        """
+        removed = self._services[index]
+        last = len(self._services) - 1
+        if index != last:
+            self._services[index] = self._services[last]
+            self._names[index] = self._names[last]
+            self._index[id(self._services[index])] = index
+        self._services.pop()
+        self._names.pop()
+        return removed
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the notification thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_NOTIFY_WORKERS,
+                thread_name_prefix="fenn-notify",
+            )
+        return self._executor
+
+    def _shutdown_executor(self) -> None:
+        """Release the notification threads, if any were started."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -1,13 +1,17 @@
-from abc import ABC, abstractmethod
+import asyncio
 from fenn.secrets.keystore import KeyStore
 
-class Service(ABC):
-    """Abstract base class for notification services."""
+class Service:
+    """Base class for notification services.
+
+    Subclasses must implement send_notification. This is a plain class
+    rather than an ABC, so services are created and dispatched without the
+    ABCMeta machinery.
+    """
 
     def __init__(self):
         self._keystore = KeyStore()
 
-    @abstractmethod
     def send_notification(self, message: str) -> None:
         """Send a notification message.
 
@@ -16,5 +20,29 @@ class Service(ABC):
 
         Raises:
             Exception: If the notification fails to send.
+            NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement send_notification"
+        )
+
+    async def send_notification_async(self, message: str) -> None:
+        """Send a notification message without blocking the event loop.
+
+        The default implementation runs send_notification in a worker thread,
+        services with a native async client can override it.
+
+        Args:
+            message: The message to send.
+
+        Raises:
+            Exception: If the notification fails to send.
+        """
+        await asyncio.to_thread(self.send_notification, message)
+
+    def close(self) -> None:
+        """Release the resources held by the service, e.g. open connections.
+
+        Called by the notifier when the service is removed. The default
+        implementation does nothing.
         """
-        pass
@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import contextvars
+import json
+from typing import Optional
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Longest Retry-After honoured, in seconds; asking for more fails the request
+MAX_RETRY_AFTER = 30
+
+
+class _CappedRetry(urllib3.Retry):
+    """Retry that gives up instead of waiting longer than MAX_RETRY_AFTER."""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                raise urllib3.exceptions.MaxRetryError(
+                    _pool,
+                    url,
+                    urllib3.exceptions.ResponseError(
+                        f"Retry-After of {retry_after:g}s exceeds {MAX_RETRY_AFTER}s"
+                    ),
+                )
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def build_session(base_url: str) -> requests.Session:
+    """Build an HTTP session for the webhooks of one service.
+
+    Consecutive messages reuse the open connection to base_url. Connection
+    failures, rate limits (429) and transient server errors are retried with
+    a backoff, honouring the Retry-After header up to MAX_RETRY_AFTER. Read
+    timeouts are not: the server may already have delivered the message.
+
+    Args:
+        base_url: Scheme and host of the service, e.g. "https://discord.com".
+
+    Returns:
+        The configured session.
+    """
+    retries = _CappedRetry(
+        total=MAX_RETRIES,
+        read=False,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        base_url,
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries),
+    )
+    return session
+
+
+def encode_json(payload: dict) -> bytes:
+    """Encode a request body, with orjson when it is installed.
+
+    Posting the encoded bytes with JSON_HEADERS skips the json.dumps pass
+    requests would otherwise run on every message.
+
+    Args:
+        payload: The JSON body.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+# Session shared by the async posts inside an async_client_session block
+_CLIENT_SESSION: contextvars.ContextVar = contextvars.ContextVar(
+    "fenn_client_session", default=None
+)
+
+
+@contextlib.asynccontextmanager
+async def async_client_session():
+    """Share one aiohttp session between the async posts made in the block.
+
+    The session is closed when the block exits, while its event loop is
+    still running. Blocks can be nested, the outermost one owns the session.
+    Does nothing when aiohttp is not installed.
+    """
+    if not AIOHTTP_AVAILABLE or _CLIENT_SESSION.get() is not None:
+        yield
+        return
+
+    async with aiohttp.ClientSession() as session:
+        token = _CLIENT_SESSION.set(session)
+        try:
+            yield
+        finally:
+            _CLIENT_SESSION.reset(token)
+
+
+async def post_json_async(url: str, payload: dict, timeout: float = 10) -> None:
+    """POST a JSON payload with aiohttp, without a worker thread.
+
+    Uses the session of the enclosing async_client_session block, or one
+    opened for this request alone. Failures are retried like build_session
+    does. Only available when aiohttp is installed, see AIOHTTP_AVAILABLE.
+
+    Args:
+        url: The URL to post to.
+        payload: The JSON body.
+        timeout: Total timeout of each attempt in seconds.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails, so that
+            callers handle the same errors as on the synchronous path.
+    """
+    body = encode_json(payload)
+
+    async with async_client_session():
+        session = _CLIENT_SESSION.get()
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                async with session.post(
+                    url,
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as response:
+                    retry = response.status in RETRY_STATUSES and not last_attempt
+                    if retry:
+                        delay = _retry_after(response.headers.get("Retry-After"), attempt)
+                        # Give up rather than block for longer than the cap
+                        retry = delay <= MAX_RETRY_AFTER
+                    if not retry:
+                        response.raise_for_status()
+                        return
+            except aiohttp.ClientConnectorError as err:
+                # The request never reached the server, so it is safe to resend
+                if last_attempt:
+                    raise requests.exceptions.ConnectionError(str(err)) from err
+                delay = BACKOFF_FACTOR * 2 ** attempt
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                raise requests.exceptions.RequestException(str(err)) from err
+            await asyncio.sleep(delay)
+
+
+def _retry_after(header: Optional[str], attempt: int) -> float:
+    """Delay before the next attempt, honouring a Retry-After header in seconds."""
+    try:
+        return max(float(header), 0.0)
+    except (TypeError, ValueError):
+        return BACKOFF_FACTOR * 2 ** attempt
@@ -1,5 +1,12 @@
 import requests
 from fenn.notification.service import Service
+from fenn.notification.services._session import (
+    AIOHTTP_AVAILABLE,
+    JSON_HEADERS,
+    build_session,
+    encode_json,
+    post_json_async,
+)
 
 
 class Discord(Service):
@@ -11,6 +18,7 @@ class Discord(Service):
         super().__init__()
 
         self._discord_webhook_url = self._keystore.get_key("DISCORD_WEBHOOK_URL")
+        self._session = build_session("https://discord.com")
 
     def send_notification(self, message: str) -> None:
         """Send notification to Discord channel.
@@ -27,7 +35,38 @@ class Discord(Service):
         }
 
         try:
-            result = requests.post(self._discord_webhook_url, json=data, timeout=10)
+            result = self._session.post(
+                self._discord_webhook_url,
+                data=encode_json(data),
+                headers=JSON_HEADERS,
+                timeout=10,
+            )
             result.raise_for_status()
         except requests.exceptions.RequestException as err:
-            raise requests.exceptions.RequestException(f"Failed to send Discord notification: {err}")
\ No newline at end of file
+            raise requests.exceptions.RequestException(f"Failed to send Discord notification: {err}")
+
+    async def send_notification_async(self, message: str) -> None:
+        """Send notification to Discord without blocking the event loop.
+
+        Uses aiohttp when it is installed, and a worker thread otherwise.
+
+        Args:
+            message: The message to send.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        if not AIOHTTP_AVAILABLE:
+            await super().send_notification_async(message)
+            return
+
+        try:
+            await post_json_async(self._discord_webhook_url, {"content": message, "username": "fenn"})
+        except requests.exceptions.RequestException as err:
+            raise requests.exceptions.RequestException(
+                f"Failed to send Discord notification: {err}"
+            ) from err
+
+    def close(self) -> None:
+        """Close the connection to Discord."""
+        self._session.close()
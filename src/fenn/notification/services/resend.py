@@ -1,7 +1,48 @@
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import requests
 import resend
+from resend.http_client import HTTPClient
+from resend.http_client_requests import RequestsClient
 from fenn.notification.service import Service
 
 
+class _SessionClient(HTTPClient):
+    """Resend HTTP client that keeps its connection to the API open.
+
+    The SDK's default client opens a new TLS connection for every email,
+    this one sends all of them through a single requests.Session.
+    """
+
+    def __init__(self, timeout: int = 30):
+        self._session = requests.Session()
+        self._timeout = timeout
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]] = None,
+        **kwargs: Any,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        try:
+            resp = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                timeout=self._timeout,
+                **kwargs,
+            )
+            return resp.content, resp.status_code, resp.headers
+        except requests.RequestException as e:
+            raise RuntimeError(f"Request failed: {e}") from e
+
+
+_HTTP_CLIENT = _SessionClient()
+
+
 class Resend(Service):
     """Resend email notification service."""
 
@@ -26,6 +67,10 @@ class Resend(Service):
         
         resend.api_key = self._api_key
 
+        # Only replace the SDK default, never a client installed by the user
+        if type(resend.default_http_client) is RequestsClient:
+            resend.default_http_client = _HTTP_CLIENT
+
     def send_notification(self, message: str) -> None:
         """Send email notification to all configured recipients.
 
@@ -1,6 +1,13 @@
 import requests
 
 from fenn.notification.service import Service
+from fenn.notification.services._session import (
+    AIOHTTP_AVAILABLE,
+    JSON_HEADERS,
+    build_session,
+    encode_json,
+    post_json_async,
+)
 
 
 class Slack(Service):
@@ -10,6 +17,7 @@ class Slack(Service):
         """Initialize Slack service."""
         super().__init__()
         self._slack_webhook_url = self._keystore.get_key("SLACK_WEBHOOK_URL")
+        self._session = build_session("https://hooks.slack.com")
 
     def send_notification(self, message: str) -> None:
         """Send notification to Slack channel.
@@ -23,9 +31,40 @@ class Slack(Service):
         data = {"text": message}
 
         try:
-            result = requests.post(self._slack_webhook_url, json=data, timeout=10)
+            result = self._session.post(
+                self._slack_webhook_url,
+                data=encode_json(data),
+                headers=JSON_HEADERS,
+                timeout=10,
+            )
             result.raise_for_status()
         except requests.exceptions.RequestException as err:
             raise requests.exceptions.RequestException(
                 f"Failed to send Slack notification: {err}"
             ) from err
+
+    async def send_notification_async(self, message: str) -> None:
+        """Send notification to Slack without blocking the event loop.
+
+        Uses aiohttp when it is installed, and a worker thread otherwise.
+
+        Args:
+            message: The message to send.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        if not AIOHTTP_AVAILABLE:
+            await super().send_notification_async(message)
+            return
+
+        try:
+            await post_json_async(self._slack_webhook_url, {"text": message})
+        except requests.exceptions.RequestException as err:
+            raise requests.exceptions.RequestException(
+                f"Failed to send Slack notification: {err}"
+            ) from err
+
+    def close(self) -> None:
+        """Close the connection to Slack."""
+        self._session.close()
@@ -1,5 +1,6 @@
 import requests
 from fenn.notification.service import Service
+from fenn.notification.services._session import JSON_HEADERS, build_session, encode_json
 from typing import Literal
 
 class Telegram(Service):
@@ -23,6 +24,15 @@ class Telegram(Service):
         self._parse_mode = parse_mode
         self._telegram_api_url = f"https://api.telegram.org/bot{self._keystore.get_key('TELEGRAM_BOT_TOKEN')}/sendMessage"
         self._chat_id = self._keystore.get_key("TELEGRAM_CHAT_ID")
+        self._session = build_session("https://api.telegram.org")
+
+        # Everything but the text is the same for every message
+        self._payload_base = {
+            "chat_id": self._chat_id,
+            "disable_notification": False,
+        }
+        if parse_mode:
+            self._payload_base["parse_mode"] = parse_mode
 
     def send_notification(self, message: str) -> None:
         """Send notification to Telegram chat.
@@ -34,17 +44,19 @@ class Telegram(Service):
             requests.exceptions.RequestException: If the request fails.
         """
 
-        data = {
-            "chat_id": self._chat_id,
-            "text": message,
-            "disable_notification": False,
-        }
-
-        if self._parse_mode:
-            data["parse_mode"] = self._parse_mode
+        data = {**self._payload_base, "text": message}
 
         try:
-            result = requests.post(self._telegram_api_url, json=data, timeout=10)
+            result = self._session.post(
+                self._telegram_api_url,
+                data=encode_json(data),
+                headers=JSON_HEADERS,
+                timeout=10,
+            )
             result.raise_for_status()
         except requests.exceptions.RequestException as err:
-            raise requests.exceptions.RequestException(f"Failed to send Telegram notification: {err}")
\ No newline at end of file
+            raise requests.exceptions.RequestException(f"Failed to send Telegram notification: {err}")
+
+    def close(self) -> None:
+        """Close the connection to Telegram."""
+        self._session.close()
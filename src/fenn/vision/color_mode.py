@@ -1,32 +1,88 @@
-import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
+import numpy as np
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
 from fenn.vision.vision_utils import detect_format, normalize_color_mode
 
+# ITU-R BT.601 luma weights, plus their Q15 fixed-point form (sum = 32768).
+# Both kernels read the three color planes only, so the alpha channel of
+# RGBA input never reaches the result (not even a NaN one). The Q15 weights and rounding are OpenCV's, so uint8 results are bit-exact
+# whether or not OpenCV is installed and whatever the memory layout.
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+_LUMA_WEIGHTS_Q15 = np.array([9798, 19235, 3735], dtype=np.uint32)
+
+# Integer batches larger than this are converted by several threads, each on
+# a slice of the batch (NumPy releases the GIL inside the kernel)
+PARALLEL_MIN_BYTES = 4 << 20
+GRAY_WORKERS = os.cpu_count() or 1
+
 
 def _gray_to_rgb(
     array: np.ndarray,
     channel_location: Literal["first", "last"] | None,
+    copy: bool = False,
 ) -> np.ndarray:
     """
     Convert grayscale array to RGB by duplicating the channel.
 
+    The three channels are a read-only broadcast view of the single gray
+    channel, so no data is copied unless requested.
+
     Args:
         array: Grayscale image array with batch dimension
         channel_location: Channel position ("first", "last", or None)
+        copy: Whether to materialize a contiguous, writable array
 
     Returns:
         RGB array with 3 channels
     """
     if channel_location is None:
         # (N, H, W) - no channel dimension → (N, H, W, 3) with channels last
-        return np.stack([array, array, array], axis=-1)
+        rgb = np.broadcast_to(array[..., np.newaxis], (*array.shape, 3))
     elif channel_location == "last":
         # (N, H, W, 1) - channels last → (N, H, W, 3)
-        return np.repeat(array, 3, axis=-1)
+        rgb = np.broadcast_to(array, (*array.shape[:-1], 3))
     else:  # channel_location == "first"
         # (N, 1, H, W) - channels first → (N, 3, H, W)
-        return np.repeat(array, 3, axis=1)
+        rgb = np.broadcast_to(array, (array.shape[0], 3, *array.shape[2:]))
+
+    return np.ascontiguousarray(rgb) if copy else rgb
+
+
+# Full-opacity alpha value of every common dtype, built once at import
+_ALPHA_MAX: dict[np.dtype, int | float] = {
+    np.dtype(t): int(np.iinfo(t).max)
+    for t in (np.uint8, np.uint16, np.uint32, np.uint64, np.int8, np.int16, np.int32, np.int64)
+}
+_ALPHA_MAX.update({np.dtype(t): 1.0 for t in (np.float16, np.float32, np.float64)})
+
+
+def _alpha_for(dtype: np.dtype) -> int | float:
+    """
+    Get the full-opacity alpha value for a dtype.
+
+    Args:
+        dtype: Array dtype
+
+    Returns:
+        1.0 for floating dtypes, the dtype's maximum for integer dtypes
+    """
+    alpha_value = _ALPHA_MAX.get(dtype)
+    if alpha_value is not None:
+        return alpha_value
+
+    # Dtypes outside the table, e.g. non-native byte order
+    if dtype.kind == 'f':  # float
+        return 1.0
+    return np.iinfo(dtype).max
 
 
 def _rgb_to_rgba(
@@ -43,27 +99,64 @@ def _rgb_to_rgba(
     Returns:
         RGBA array with 4 channels
     """
-    # Get alpha value for dtype (full opacity)
-    if array.dtype == np.uint8:
-        alpha_value = 255
-    elif array.dtype.kind == 'f':  # float
-        alpha_value = 1.0
-    else:
-        alpha_value = np.iinfo(array.dtype).max
+    alpha_value = _alpha_for(array.dtype)
 
+    # Write straight into the output instead of concatenating a separate alpha
+    # plane; fill() sets alpha without broadcasting a scalar array
     if channel_location == "last":
         # (N, H, W, 3) → (N, H, W, 4)
-        alpha = np.full((*array.shape[:-1], 1), alpha_value, dtype=array.dtype)
-        return np.concatenate([array, alpha], axis=-1)
+        rgba = np.empty((*array.shape[:-1], 4), dtype=array.dtype)
+        np.copyto(rgba[..., :3], array)
+        rgba[..., 3].fill(alpha_value)
     else:  # channel_location == "first"
         # (N, 3, H, W) → (N, 4, H, W)
-        alpha = np.full((array.shape[0], 1, *array.shape[2:]), alpha_value, dtype=array.dtype)
-        return np.concatenate([array, alpha], axis=1)
+        rgba = np.empty((array.shape[0], 4, *array.shape[2:]), dtype=array.dtype)
+        np.copyto(rgba[:, :3], array)
+        rgba[:, 3].fill(alpha_value)
+    return rgba
+
+
+def _gray_to_rgba(
+    array: np.ndarray,
+    channel_location: Literal["first", "last"] | None,
+) -> np.ndarray:
+    """
+    Convert grayscale array to RGBA by duplicating the channel and adding alpha.
+
+    The gray channel is broadcast straight into the color channels of the
+    output, so the batch is written once.
+
+    Args:
+        array: Grayscale image array with batch dimension
+        channel_location: Channel position ("first", "last", or None)
+
+    Returns:
+        RGBA array with 4 channels (channels last if the input had no channel dimension)
+    """
+    alpha_value = _alpha_for(array.dtype)
+
+    if channel_location == "first":
+        # (N, 1, H, W) → (N, 4, H, W)
+        rgba = np.empty((array.shape[0], 4, *array.shape[2:]), dtype=array.dtype)
+        np.copyto(rgba[:, :3], array)
+        rgba[:, 3].fill(alpha_value)
+        return rgba
+
+    if channel_location is None:
+        # (N, H, W) → (N, H, W, 1) so it broadcasts over the channels
+        array = array[..., np.newaxis]
+
+    # (N, H, W, 1) → (N, H, W, 4)
+    rgba = np.empty((*array.shape[:-1], 4), dtype=array.dtype)
+    np.copyto(rgba[..., :3], array)
+    rgba[..., 3].fill(alpha_value)
+    return rgba
 
 
 def _rgba_to_rgb(
     array: np.ndarray,
     channel_location: Literal["first", "last"],
+    copy: bool = False,
 ) -> np.ndarray:
     """
     Convert RGBA array to RGB by dropping alpha channel.
@@ -71,16 +164,52 @@ def _rgba_to_rgb(
     Args:
         array: RGBA image array with batch dimension
         channel_location: Channel position ("first" or "last")
+        copy: Whether to copy the color channels instead of returning a view
 
     Returns:
-        RGB array with 3 channels
+        RGB array with 3 channels, a read-only view of the input unless copied
     """
     if channel_location == "last":
         # (N, H, W, 4) → (N, H, W, 3)
-        return array[..., :3]
+        rgb = array[..., :3]
     else:  # channel_location == "first"
         # (N, 4, H, W) → (N, 3, H, W)
-        return array[:, :3, ...]
+        rgb = array[:, :3, ...]
+    if copy:
+        return rgb.copy()
+    # Like every view returned by ensure_color_mode, writes cannot reach the input
+    rgb.flags.writeable = False
+    return rgb
+
+
+def _planes_to_gray_u8(
+    red: np.ndarray,
+    green: np.ndarray,
+    blue: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Write the luma of uint8 color planes into out.
+
+    Q15 fixed point keeps uint8 inputs in integer math. One multiply-add per
+    color plane into a uint32 accumulator, through a single scratch plane,
+    vectorizes far better than an integer einsum.
+
+    Args:
+        red: Red plane, (N, H, W)
+        green: Green plane, (N, H, W)
+        blue: Blue plane, (N, H, W)
+        out: uint8 array of the same shape receiving the gray values
+    """
+    gray = np.multiply(red, _LUMA_WEIGHTS_Q15[0], dtype=np.uint32)
+    scratch = np.multiply(green, _LUMA_WEIGHTS_Q15[1], dtype=np.uint32)
+    gray += scratch
+    np.multiply(blue, _LUMA_WEIGHTS_Q15[2], out=scratch)
+    gray += scratch
+    # Round to nearest
+    gray += 1 << 14
+    gray >>= 15
+    np.copyto(out, gray, casting="unsafe")
 
 
 def _rgb_to_gray(
@@ -88,28 +217,68 @@ def _rgb_to_gray(
     channel_location: Literal["first", "last"],
 ) -> np.ndarray:
     """
-    Convert RGB array to grayscale using standard luminance weights.
+    Convert RGB or RGBA array to grayscale using standard luminance weights.
 
-    Uses ITU-R BT.601 weights: 0.299*R + 0.587*G + 0.114*B
+    Uses ITU-R BT.601 weights: 0.299*R + 0.587*G + 0.114*B. The alpha channel
+    of RGBA input is ignored.
 
     Args:
-        array: RGB image array with batch dimension
+        array: RGB or RGBA image array with batch dimension
         channel_location: Channel position ("first" or "last")
 
     Returns:
         Grayscale array with 1 channel (or no channel dimension if channels were last)
     """
-    weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
-
     if channel_location == "last":
-        # (N, H, W, 3) → (N, H, W)
-        gray_float = np.sum(array.astype(np.float32) * weights, axis=-1)
-        return gray_float.astype(array.dtype)
+        # (N, H, W, C) → (N, H, W)
+        channels = array.shape[-1]
+        red, green, blue = array[..., 0], array[..., 1], array[..., 2]
     else:  # channel_location == "first"
-        # (N, 3, H, W) → (N, H, W)
-        weights_reshaped = weights.reshape(3, 1, 1)
-        gray_float = np.sum(array.astype(np.float32) * weights_reshaped, axis=1)
-        return gray_float.astype(array.dtype)
+        # (N, C, H, W) → (N, H, W)
+        channels = array.shape[1]
+        red, green, blue = array[:, 0], array[:, 1], array[:, 2]
+
+    if (
+        CV2_AVAILABLE
+        and array.dtype == np.uint8
+        and channel_location == "last"
+        and array.flags.c_contiguous
+        and array.size
+    ):
+        # OpenCV's SIMD kernel; the batch is converted as one (N*H, W, C) image
+        n, height, width, _ = array.shape
+        code = cv2.COLOR_RGB2GRAY if channels == 3 else cv2.COLOR_RGBA2GRAY
+        gray = cv2.cvtColor(array.reshape(n * height, width, channels), code)
+        return gray.reshape(n, height, width)
+
+    if array.dtype == np.uint8:
+        gray = np.empty(red.shape, dtype=np.uint8)
+        n = array.shape[0]
+        workers = min(GRAY_WORKERS, n) if array.nbytes > PARALLEL_MIN_BYTES else 1
+        if workers <= 1:
+            _planes_to_gray_u8(red, green, blue, gray)
+            return gray
+
+        bounds = np.linspace(0, n, workers + 1, dtype=int)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consuming the results surfaces any error of a worker
+            list(executor.map(
+                lambda start, stop: _planes_to_gray_u8(
+                    red[start:stop], green[start:stop], blue[start:stop], gray[start:stop]
+                ),
+                bounds[:-1],
+                bounds[1:],
+            ))
+        return gray
+
+    # A stacked matrix-vector product reads every pixel once. It takes any
+    # strides, so slicing alpha off or flattening a non-contiguous input
+    # copies nothing
+    if channel_location == "last":
+        gray_float = array[..., :3] @ _LUMA_WEIGHTS
+    else:
+        gray_float = np.moveaxis(array[:, :3], 1, -1) @ _LUMA_WEIGHTS
+    return gray_float.astype(array.dtype, copy=False)
 
 
 def _convert_color_mode(
@@ -117,6 +286,7 @@ def _convert_color_mode(
     current_mode: str,
     target_mode: str,
     channel_location: Literal["first", "last"] | None,
+    copy: bool = False,
 ) -> np.ndarray:
     """
     Convert array from current_mode to target_mode.
@@ -126,22 +296,27 @@ def _convert_color_mode(
         current_mode: Current color mode ("GRAY", "RGB", or "RGBA")
         target_mode: Target color mode ("GRAY", "RGB", or "RGBA")
         channel_location: Channel position ("first", "last", or None)
+        copy: Whether views of the input must be materialized as copies
 
     Returns:
         Converted array in target mode
     """
-    # Safety check: if already in target mode, return a copy
+    # Already in target mode: a new, read-only array object over the same
+    # buffer so writes to the result cannot reach the caller's input,
+    # unless a copy is requested
     if current_mode == target_mode:
-        return array.copy()
+        if copy:
+            return array.copy()
+        view = array.view()
+        view.flags.writeable = False
+        return view
 
     # Perform conversions using helper functions
     if current_mode == "GRAY":
         if target_mode == "RGB":
-            return _gray_to_rgb(array, channel_location)
+            return _gray_to_rgb(array, channel_location, copy)
         else:  # target_mode == "RGBA"
-            rgb = _gray_to_rgb(array, channel_location)
-            effective_channel_location = channel_location if channel_location is not None else "last"
-            return _rgb_to_rgba(rgb, effective_channel_location)
+            return _gray_to_rgba(array, channel_location)
 
     elif current_mode == "RGB":
         if target_mode == "GRAY":
@@ -151,13 +326,12 @@ def _convert_color_mode(
 
     else:  # current_mode == "RGBA"
         if target_mode == "RGB":
-            return _rgba_to_rgb(array, channel_location)
+            return _rgba_to_rgb(array, channel_location, copy)
         else:  # target_mode == "GRAY"
-            rgb = _rgba_to_rgb(array, channel_location)
-            return _rgb_to_gray(rgb, channel_location)
+            return _rgb_to_gray(array, channel_location)
 
 
-def ensure_color_mode(array: np.ndarray, mode: str = "RGB") -> np.ndarray:
+def ensure_color_mode(array: np.ndarray, mode: str = "RGB", copy: bool = False) -> np.ndarray:
     """
     Convert grayscale / RGB / RGBA images to the desired channel layout.
     
@@ -175,6 +349,11 @@ def ensure_color_mode(array: np.ndarray, mode: str = "RGB") -> np.ndarray:
             - "RGB" - 3 channels (default)
             - "RGBA" - 4 channels with alpha
             - "L" or "GRAY" - 1 channel grayscale
+        copy: If True, always return an array that does not share memory with
+            the input. By default conversions that need no new data return
+            read-only views of the input: GRAY → RGB a broadcast view,
+            RGBA → RGB the color channels, and an input already in the
+            target mode a view of itself.
 
     Returns:
         Array converted to the specified color mode, preserving:
@@ -232,4 +411,4 @@ def ensure_color_mode(array: np.ndarray, mode: str = "RGB") -> np.ndarray:
             )
 
     # Convert using helper function
-    return _convert_color_mode(array, current_mode, target_mode, channel_location)
+    return _convert_color_mode(array, current_mode, target_mode, channel_location, copy)
@@ -1,20 +1,31 @@
 import numpy as np
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 try:
     import torch
     from torchvision.transforms import functional as F
     TORCHVISION_AVAILABLE = True
+
+    _INTERPOLATION_MAP = {
+        "nearest": F.InterpolationMode.NEAREST,
+        "nearest_exact": F.InterpolationMode.NEAREST_EXACT,
+        "bilinear": F.InterpolationMode.BILINEAR,
+        "bicubic": F.InterpolationMode.BICUBIC,
+    }
 except ImportError:
     TORCHVISION_AVAILABLE = False
 
 from fenn.vision.vision_utils import detect_format
 
+# Below this input size the host-to-device copy outweighs the faster GPU resize
+GPU_MIN_BYTES = 8 << 20
+
 
 def resize_batch(
     array: np.ndarray,
     size: Union[int, Tuple[int, int]],
-    interpolation: str = "bilinear"
+    interpolation: str = "bilinear",
+    device: Optional[str] = None,
 ) -> np.ndarray:
     """
     Resize a batch of images to a target size, preserving channel order and dtype where possible.
@@ -36,6 +47,10 @@ def resize_batch(
         interpolation: Interpolation method to use. Default is "bilinear".
             Supported methods: "nearest", "nearest_exact", "bilinear", "bicubic"
 
+        device: Torch device to resize on (e.g. "cpu", "cuda"). Default is None,
+            which uses CUDA for batches of at least GPU_MIN_BYTES when it is
+            available and the CPU otherwise.
+
     Returns:
         Resized image array with the same:
             - Batch size (N)
@@ -93,13 +108,7 @@ def resize_batch(
             "Install it with: pip install fenn[torch] or pip install torchvision"
         )
 
-    interpolation_map = {
-        "nearest": F.InterpolationMode.NEAREST,
-        "nearest_exact": F.InterpolationMode.NEAREST_EXACT,
-        "bilinear": F.InterpolationMode.BILINEAR,
-        "bicubic": F.InterpolationMode.BICUBIC,
-    }
-    torch_interpolation = interpolation_map[interpolation]
+    torch_interpolation = _INTERPOLATION_MAP[interpolation]
 
     # Store original dtype and shape info
     original_dtype = array.dtype
@@ -117,18 +126,22 @@ def resize_batch(
         original_height, original_width = array.shape[1], array.shape[2]
     is_downsampling = (original_height > target_height) or (original_width > target_width)
 
-    # Normalize to channels-first format (N, C, H, W) for torchvision
-    if channel_location == "last":
-        # (N, H, W, C) -> (N, C, H, W)
-        array = np.transpose(array, (0, 3, 1, 2))
-    elif channel_location is None:
-        # (N, H, W) -> (N, 1, H, W) for grayscale
+    # Add the channel axis to grayscale batches: (N, H, W) -> (N, 1, H, W)
+    if channel_location is None:
         array = array[:, np.newaxis, :, :]
 
-    # Convert to torch tensor
+    # Torch tensors cannot wrap read-only arrays (e.g. broadcast views) or
+    # negative strides (e.g. flipped images)
+    if not array.flags.writeable or any(stride < 0 for stride in array.strides):
+        array = array.copy()
+
+    # Convert to torch tensor, sharing memory when no dtype change is needed
     if original_dtype == np.uint8:
         # Use uint8 directly - torchvision supports it natively
-        tensor = torch.from_numpy(array.astype(np.uint8))
+        tensor = torch.from_numpy(array)
+        needs_normalization = False
+    elif original_dtype == np.float32:
+        tensor = torch.from_numpy(array)
         needs_normalization = False
     elif np.issubdtype(original_dtype, np.floating):
         # Float arrays: assume [0, 1] range, convert to float32
@@ -137,10 +150,24 @@ def resize_batch(
     else:
         # Other integer types: convert to float32 and normalize to [0, 1]
         tensor = torch.from_numpy(array.astype(np.float32))
-        max_val = float(np.iinfo(original_dtype).max)
-        tensor = tensor / max_val
         needs_normalization = True
 
+    # Large batches are resized on the GPU when one is available
+    if device is None:
+        batch_bytes = tensor.numel() * tensor.element_size()
+        use_cuda = batch_bytes >= GPU_MIN_BYTES and torch.cuda.is_available()
+        device = "cuda" if use_cuda else "cpu"
+    tensor = tensor.to(device)
+
+    if needs_normalization:
+        tensor = tensor / float(np.iinfo(original_dtype).max)
+
+    # Normalize to channels-first format (N, C, H, W) for torchvision; the
+    # permuted copy is done by torch's multi-threaded kernels
+    if channel_location == "last":
+        # (N, H, W, C) -> (N, C, H, W)
+        tensor = tensor.permute(0, 3, 1, 2).contiguous()
+
     # Enable antialiasing only when downsampling with smooth interpolation methods
     use_antialias = (
         is_downsampling and
@@ -156,7 +183,7 @@ def resize_batch(
     )
 
     # Convert back to numpy
-    result = resized_tensor.numpy()
+    result = resized_tensor.cpu().numpy()
 
     # Convert back to original dtype
     if needs_normalization:
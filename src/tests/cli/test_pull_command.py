@@ -1,10 +1,14 @@
+import io
+import json
+import os
 import pytest
+import tarfile
 import tempfile
-import zipfile
 from pathlib import Path
 from unittest.mock import patch, Mock
 import requests
 
+import fenn.cli.pull_command as pull_command
 from fenn.cli.pull_command import (
     execute,
     _download_template,
@@ -13,6 +17,41 @@ from fenn.cli.pull_command import (
     TemplateError,
 )
 
+API_URL = "https://api.github.com/repos/pyfenn/fenn/contents/templates"
+COMMIT_URL = "https://api.github.com/repos/pyfenn/fenn/commits/main"
+COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+ARCHIVE_URL = f"https://github.com/pyfenn/fenn/archive/{COMMIT_SHA}.tar.gz"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the GitHub response cache out of the user's home directory."""
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(pull_command, "CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def latest_commit(requests_mock):
+    """Resolve the templates branch to a fixed commit."""
+    requests_mock.get(COMMIT_URL, status_code=200, text=COMMIT_SHA)
+
+
+def make_archive(entries):
+    """Build an in-memory .tar.gz; names ending with '/' become directories."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+        for name, content in entries.items():
+            info = tarfile.TarInfo(name.rstrip("/"))
+            if name.endswith("/"):
+                info.type = tarfile.DIRTYPE
+                tf.addfile(info)
+            else:
+                data = content.encode()
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
 
 class TestPullCommand:
     """Test suite for the fenn pull command."""
@@ -24,31 +63,20 @@ class TestPullCommand:
         args.path = str(tmp_path)
         args.force = False
 
-        # Mock GitHub API response for template existence check
+        # Create a mock archive content
+        archive = make_archive({
+            "fenn-main/templates/base/main.py": "print('hello')",
+            "fenn-main/templates/base/fenn.yaml": "project: test",
+            "fenn-main/templates/base/.gitignore": ".env",
+        })
+
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=200,
-            json={"name": "base", "type": "dir"}
+            content=archive
         )
 
-        # Create a mock zip file content
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_zip:
-            with zipfile.ZipFile(tmp_zip.name, 'w') as zf:
-                zf.writestr("templates-main/base/main.py", "print('hello')")
-                zf.writestr("templates-main/base/fenn.yaml", "project: test")
-                zf.writestr("templates-main/base/.gitignore", ".env")
-            
-            # Mock archive download
-            with open(tmp_zip.name, 'rb') as f:
-                zip_content = f.read()
-            
-            requests_mock.get(
-                "https://github.com/pyfenn/templates/archive/refs/heads/main.zip",
-                status_code=200,
-                content=zip_content
-            )
-
-            execute(args)
+        execute(args)
         
         # Verify files were extracted
         assert (tmp_path / "main.py").exists()
@@ -64,8 +92,9 @@ class TestPullCommand:
         args.force = False
 
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/nonexistent",
-            status_code=404
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
         )
 
         with pytest.raises(SystemExit) as exc_info:
@@ -77,23 +106,23 @@ class TestPullCommand:
         assert "nonexistent" in captured.out
 
     def test_pull_network_error_on_check(self, requests_mock, capsys, tmp_path):
-        """Test pull with network error during template check."""
+        """Test pull with network error while resolving the latest revision."""
         args = Mock()
         args.template = "base"
         args.path = str(tmp_path)
         args.force = False
 
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            COMMIT_URL,
             exc=requests.exceptions.ConnectionError("Network error")
         )
 
         with pytest.raises(SystemExit) as exc_info:
             execute(args)
-        
+
         assert exc_info.value.code == 1
         captured = capsys.readouterr()
-        assert "Network error" in captured.out
+        assert "Failed to resolve latest templates revision" in captured.out
 
     def test_pull_network_error_on_download(self, requests_mock, capsys, tmp_path):
         """Test pull with network error during archive download."""
@@ -103,13 +132,7 @@ class TestPullCommand:
         args.force = False
 
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
-            status_code=200,
-            json={"name": "base", "type": "dir"}
-        )
-
-        requests_mock.get(
-            "https://github.com/pyfenn/templates/archive/refs/heads/main.zip",
+            ARCHIVE_URL,
             exc=requests.exceptions.ConnectionError("Network error")
         )
 
@@ -147,27 +170,18 @@ class TestPullCommand:
         args.path = str(tmp_path)
         args.force = True
 
+        # Create a mock archive content
+        archive = make_archive({
+            "fenn-main/templates/base/main.py": "print('hello')",
+        })
+
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=200,
-            json={"name": "base", "type": "dir"}
+            content=archive
         )
 
-        # Create a mock zip file content
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_zip:
-            with zipfile.ZipFile(tmp_zip.name, 'w') as zf:
-                zf.writestr("templates-main/base/main.py", "print('hello')")
-            
-            with open(tmp_zip.name, 'rb') as f:
-                zip_content = f.read()
-            
-            requests_mock.get(
-                "https://github.com/pyfenn/templates/archive/refs/heads/main.zip",
-                status_code=200,
-                content=zip_content
-            )
-
-            execute(args)
+        execute(args)
 
         # Verify new files were extracted
         assert (tmp_path / "main.py").exists()
@@ -186,116 +200,139 @@ class TestPullCommand:
         captured = capsys.readouterr()
         assert "Template name is required" in captured.out
 
-    def test_download_template_empty_template(self, requests_mock, tmp_path):
-        """Test downloading an empty template."""
+    def test_download_template_missing_from_archive(self, requests_mock, tmp_path):
+        """Test that a template absent from the archive is reported as not found."""
+        archive = make_archive({
+            "fenn-main/templates/other/file.txt": "content",
+        })
+
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=200,
-            json={"name": "base", "type": "dir"}
+            content=archive
         )
 
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_zip:
-            with zipfile.ZipFile(tmp_zip.name, 'w') as zf:
-                # Create zip with no template files (only other files)
-                zf.writestr("templates-main/other/file.txt", "content")
-            
-            with open(tmp_zip.name, 'rb') as f:
-                zip_content = f.read()
-            
-            requests_mock.get(
-                "https://github.com/pyfenn/templates/archive/refs/heads/main.zip",
-                status_code=200,
-                content=zip_content
-            )
-
-            with pytest.raises(TemplateError) as exc_info:
-                _download_template("base", tmp_path, False)
-            
-            assert "base" in str(exc_info.value)
-            assert "empty" in str(exc_info.value).lower()
-            assert "unexpected structure" in str(exc_info.value).lower()
+        with pytest.raises(TemplateNotFoundError) as exc_info:
+            _download_template("base", tmp_path, False)
+
+        assert "base" in str(exc_info.value)
+        assert "not found" in str(exc_info.value)
+        assert not any(tmp_path.iterdir())
+
+    def test_download_template_corrupt_archive(self, requests_mock, tmp_path):
+        """Test that an archive which is not a valid tarball raises TemplateError."""
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=b"not a tarball"
+        )
+
+        with pytest.raises(TemplateError) as exc_info:
+            _download_template("base", tmp_path, False)
+
+        assert "Failed to extract template archive" in str(exc_info.value)
 
     def test_download_template_nested_structure(self, requests_mock, tmp_path):
         """Test downloading template with nested directory structure."""
+        archive = make_archive({
+            "fenn-main/templates/base/main.py": "print('hello')",
+            "fenn-main/templates/base/models/model.py": "class Model: pass",
+            "fenn-main/templates/base/dataset/data.py": "data = []",
+        })
+
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=200,
-            json={"name": "base", "type": "dir"}
+            content=archive
         )
 
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_zip:
-            with zipfile.ZipFile(tmp_zip.name, 'w') as zf:
-                zf.writestr("templates-main/base/main.py", "print('hello')")
-                zf.writestr("templates-main/base/models/model.py", "class Model: pass")
-                zf.writestr("templates-main/base/dataset/data.py", "data = []")
-            
-            with open(tmp_zip.name, 'rb') as f:
-                zip_content = f.read()
-            
-            requests_mock.get(
-                "https://github.com/pyfenn/templates/archive/refs/heads/main.zip",
-                status_code=200,
-                content=zip_content
-            )
-
-            _download_template("base", tmp_path, False)
+        _download_template("base", tmp_path, False)
 
         # Verify nested structure was preserved
         assert (tmp_path / "main.py").exists()
         assert (tmp_path / "models" / "model.py").exists()
         assert (tmp_path / "dataset" / "data.py").exists()
 
+    def test_download_template_large_file(self, requests_mock, tmp_path):
+        """Test that files above the streaming threshold are extracted intact."""
+        large_content = "0123456789abcdef" * (1 << 17)  # 2 MiB
+        archive = make_archive({
+            "fenn-main/templates/base/main.py": "print('hello')",
+            "fenn-main/templates/base/data/weights.txt": large_content,
+        })
+
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=archive
+        )
+
+        _download_template("base", tmp_path, False)
+
+        assert (tmp_path / "main.py").read_text() == "print('hello')"
+        assert (tmp_path / "data" / "weights.txt").read_text() == large_content
+
+    def test_download_template_stops_after_template(self, requests_mock, tmp_path):
+        """Test that the archive is not read past the template directory."""
+        archive = make_archive({
+            "fenn-main/templates/base/main.py": "print('hello')",
+            "fenn-main/templates/other/data.txt": os.urandom(1 << 16).hex(),
+        })
+
+        # A truncated tail only fails if it is actually decompressed
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=archive[:len(archive) // 2]
+        )
+
+        _download_template("base", tmp_path, False)
+
+        assert (tmp_path / "main.py").read_text() == "print('hello')"
+        assert not (tmp_path / "data.txt").exists()
+
     def test_download_template_http_error_500(self, requests_mock):
         """Test handling of HTTP 500 error."""
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=500
         )
 
         with pytest.raises(NetworkError) as exc_info:
             _download_template("base", Path(tempfile.mkdtemp()), False)
         
-        assert "Failed to check template existence" in str(exc_info.value)
+        assert "Failed to download template archive" in str(exc_info.value)
         assert "500" in str(exc_info.value)
 
     def test_download_template_http_error_403(self, requests_mock):
         """Test handling of HTTP 403 error (rate limit, etc.)."""
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=403
         )
 
         with pytest.raises(NetworkError) as exc_info:
             _download_template("base", Path(tempfile.mkdtemp()), False)
         
-        assert "Failed to check template existence" in str(exc_info.value)
+        assert "Failed to download template archive" in str(exc_info.value)
         assert "403" in str(exc_info.value)
 
     def test_download_template_empty_directories(self, requests_mock, tmp_path):
         """Test downloading template with empty directories."""
+        archive = make_archive({
+            "fenn-main/templates/base/main.py": "print('hello')",
+            "fenn-main/templates/base/logger/": "",  # Empty directory
+            "fenn-main/templates/base/dataset/": "",  # Empty directory
+            "fenn-main/templates/base/models/": "",  # Empty directory
+        })
+
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents/base",
+            ARCHIVE_URL,
             status_code=200,
-            json={"name": "base", "type": "dir"}
+            content=archive
         )
 
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp_zip:
-            with zipfile.ZipFile(tmp_zip.name, 'w') as zf:
-                zf.writestr("templates-main/base/main.py", "print('hello')")
-                zf.writestr("templates-main/base/logger/", "")  # Empty directory
-                zf.writestr("templates-main/base/dataset/", "")  # Empty directory
-                zf.writestr("templates-main/base/models/", "")  # Empty directory
-            
-            with open(tmp_zip.name, 'rb') as f:
-                zip_content = f.read()
-            
-            requests_mock.get(
-                "https://github.com/pyfenn/templates/archive/refs/heads/main.zip",
-                status_code=200,
-                content=zip_content
-            )
-
-            _download_template("base", tmp_path, False)
+        _download_template("base", tmp_path, False)
 
         # Verify files and empty directories were created
         assert (tmp_path / "main.py").exists()
@@ -317,7 +354,7 @@ class TestPullCommand:
 
         # Mock GitHub API response for listing repository contents
         requests_mock.get(
-            "https://api.github.com/repos/pyfenn/templates/contents",
+            API_URL,
             status_code=200,
             json=[
                 {"name": "base", "type": "dir"},
@@ -336,3 +373,166 @@ class TestPullCommand:
         assert "mlp" in captured.out
         assert "README.md" not in captured.out  # Files should be filtered out
         assert "fenn pull <template>" in captured.out
+
+    def test_list_templates_uses_etag_cache(self, requests_mock, capsys):
+        """Test that a 304 on --list is served from the cached response."""
+        args = Mock()
+        args.template = None
+        args.list = True
+
+        requests_mock.get(
+            API_URL,
+            [
+                {
+                    "status_code": 200,
+                    "json": [{"name": "base", "type": "dir"}],
+                    "headers": {"ETag": '"abc123"'},
+                },
+                {"status_code": 304},
+            ]
+        )
+
+        execute(args)
+        capsys.readouterr()
+        execute(args)
+
+        assert requests_mock.last_request.headers["If-None-Match"] == '"abc123"'
+        captured = capsys.readouterr()
+        assert "base" in captured.out
+
+    def test_download_template_reuses_cached_archive(self, requests_mock, tmp_path):
+        """Test that a second pull of the same revision skips the download."""
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        _download_template("base", tmp_path / "first", False)
+        _download_template("base", tmp_path / "second", False)
+
+        archive_requests = [r for r in requests_mock.request_history if r.url == ARCHIVE_URL]
+        assert len(archive_requests) == 1
+        assert (tmp_path / "second" / "main.py").read_text() == "print('hello')"
+
+    def test_download_template_drops_corrupt_cached_archive(self, requests_mock, tmp_path, cache_dir):
+        """Test that a cached archive which cannot be extracted is downloaded again."""
+        (cache_dir / f"templates-{COMMIT_SHA}.tar.gz").write_bytes(b"not a tarball")
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        with pytest.raises(TemplateError):
+            _download_template("base", tmp_path / "first", False)
+        _download_template("base", tmp_path / "second", False)
+
+        assert (tmp_path / "second" / "main.py").read_text() == "print('hello')"
+
+    def test_download_template_leaves_no_temporary_files(self, requests_mock, tmp_path, cache_dir):
+        """Test that the archive and ETag cache are written without leftovers."""
+        requests_mock.get(
+            COMMIT_URL,
+            status_code=200,
+            text=COMMIT_SHA,
+            headers={"ETag": '"abc"'}
+        )
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        _download_template("base", tmp_path, False)
+
+        assert sorted(path.name for path in cache_dir.iterdir()) == [
+            "github_etag.json", f"templates-{COMMIT_SHA}.tar.gz"
+        ]
+
+    def test_download_template_requests_only_the_sha(self, requests_mock, tmp_path, cache_dir):
+        """Test that the latest revision is fetched and cached as a bare SHA."""
+        requests_mock.get(
+            COMMIT_URL,
+            status_code=200,
+            text=COMMIT_SHA + "\n",
+            headers={"ETag": '"abc"'}
+        )
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        _download_template("base", tmp_path, False)
+
+        commit_request = requests_mock.request_history[0]
+        assert commit_request.headers["Accept"] == "application/vnd.github.sha"
+        cached = json.loads((cache_dir / "github_etag.json").read_text())
+        assert cached == {
+            f"application/vnd.github.sha {COMMIT_URL}": {"etag": '"abc"', "body": COMMIT_SHA + "\n"}
+        }
+
+    def test_download_template_cache_not_writable(self, requests_mock, tmp_path, cache_dir, monkeypatch):
+        """Test that a cached archive is used when its mtime cannot be refreshed."""
+        (cache_dir / f"templates-{COMMIT_SHA}.tar.gz").write_bytes(
+            make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        def utime(path, *args, **kwargs):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(pull_command.os, "utime", utime)
+
+        _download_template("base", tmp_path, False)
+
+        assert (tmp_path / "main.py").read_text() == "print('hello')"
+
+    def test_download_template_archive_evicted_meanwhile(self, requests_mock, tmp_path, cache_dir):
+        """Test that eviction skips archives a concurrent pull already removed."""
+        (cache_dir / "templates-gone.tar.gz").symlink_to(cache_dir / "missing")
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        _download_template("base", tmp_path, False)
+
+        assert (tmp_path / "main.py").read_text() == "print('hello')"
+
+    def test_download_template_evicts_old_archives(self, requests_mock, tmp_path, cache_dir):
+        """Test that only the most recently used archives are kept."""
+        for age, sha in enumerate(["old1", "old2", "old3"]):
+            stale = cache_dir / f"templates-{sha}.tar.gz"
+            stale.write_bytes(b"")
+            os.utime(stale, (age, age))
+
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        _download_template("base", tmp_path, False)
+
+        cached = sorted(path.name for path in cache_dir.glob("templates-*.tar.gz"))
+        assert cached == sorted([
+            f"templates-{COMMIT_SHA}.tar.gz", "templates-old2.tar.gz", "templates-old3.tar.gz"
+        ])
+
+    def test_download_template_unwritable_cache(self, requests_mock, tmp_path, monkeypatch):
+        """Test that pulling still works when the cache dir cannot be created."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        monkeypatch.setattr(pull_command, "CACHE_DIR", blocker / "cache")
+
+        requests_mock.get(
+            ARCHIVE_URL,
+            status_code=200,
+            content=make_archive({"fenn-main/templates/base/main.py": "print('hello')"})
+        )
+
+        _download_template("base", tmp_path / "project", False)
+
+        assert (tmp_path / "project" / "main.py").read_text() == "print('hello')"
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import requests
 from fenn.notification.services.discord import Discord
@@ -48,3 +50,12 @@ class TestDiscord:
             )
         
         assert "400" in str(exc_info.value)
+
+    def test_send_notification_async_without_aiohttp(self, monkeypatch, mock_discord_response, message):
+        monkeypatch.setattr("fenn.notification.services.discord.AIOHTTP_AVAILABLE", False)
+        url = "https://discord.com/api/webhooks/123/abc"
+        mock_result = mock_discord_response(url, 204, {})
+
+        asyncio.run(Discord().send_notification_async(message))
+
+        assert mock_result.last_request.json() == {"content": message, "username": "fenn"}
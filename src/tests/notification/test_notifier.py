@@ -0,0 +1,396 @@
+import asyncio
+import gc
+import logging
+import queue
+import threading
+import weakref
+
+import pytest
+
+from fenn.notification import Notifier, Service
+from fenn.notification.notifier import _STOP, _drain
+
+
+class RecordingService(Service):
+    """Service that records the messages it was asked to send."""
+
+    sent = []
+
+    def send_notification(self, message: str) -> None:
+        self.sent.append((self.__class__.__name__, message))
+
+
+class FailingService(Service):
+    """Service that always fails to send."""
+
+    def send_notification(self, message: str) -> None:
+        raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def reset_sent():
+    RecordingService.sent = []
+
+
+class TestNotifier:
+    def test_notify_without_services(self):
+        Notifier().notify("nobody listens")
+
+        assert RecordingService.sent == []
+
+    def test_notify_sends_to_all_services(self):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Other])
+        notifier.notify("hello")
+
+        assert sorted(RecordingService.sent) == [("Other", "hello"), ("RecordingService", "hello")]
+
+    def test_failing_service_does_not_block_others(self):
+        notifier = Notifier()
+        notifier.add_services([FailingService, RecordingService])
+        notifier.notify("hello")
+
+        assert RecordingService.sent == [("RecordingService", "hello")]
+
+    def test_notify_runs_services_concurrently(self):
+        # Each send waits for the other one: this only completes if both are in flight at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        class First(RecordingService):
+            def send_notification(self, message: str) -> None:
+                barrier.wait()
+                super().send_notification(message)
+
+        class Second(First):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([First, Second])
+        notifier.notify("hello")
+
+        assert sorted(RecordingService.sent) == [("First", "hello"), ("Second", "hello")]
+
+    def test_notify_inside_running_event_loop(self):
+        notifier = Notifier()
+        notifier.add_service(RecordingService)
+
+        async def main():
+            notifier.notify("from a loop")
+
+        asyncio.run(main())
+
+        assert RecordingService.sent == [("RecordingService", "from a loop")]
+
+    def test_notify_async(self):
+        notifier = Notifier()
+        notifier.add_services([RecordingService, FailingService])
+
+        asyncio.run(notifier.notify_async("hello"))
+
+        assert RecordingService.sent == [("RecordingService", "hello")]
+
+    def test_notify_reuses_thread_pool(self):
+        notifier = Notifier()
+        notifier.add_service(RecordingService)
+
+        notifier.notify("first")
+        executor = notifier._executor
+        notifier.notify("second")
+
+        assert notifier._executor is executor
+        assert RecordingService.sent == [("RecordingService", "first"), ("RecordingService", "second")]
+
+    def test_clear_services_shuts_down_thread_pool(self):
+        notifier = Notifier()
+        notifier.add_service(RecordingService)
+        notifier.notify("hello")
+
+        notifier.clear_services()
+
+        assert notifier._executor is None
+
+    def test_clear_services_closes_services(self):
+        closed = []
+
+        class Closing(RecordingService):
+            def close(self) -> None:
+                closed.append(self.__class__.__name__)
+
+        notifier = Notifier()
+        notifier.add_services([Closing, RecordingService])
+        notifier.clear_services()
+
+        assert closed == ["Closing"]
+        assert notifier.get_services() == []
+
+    def test_get_services(self):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Other])
+
+        names = notifier.get_services()
+        names.append("Mutated")
+
+        assert notifier.get_services() == ["RecordingService", "Other"]
+
+    def test_add_service_instance(self):
+        notifier = Notifier()
+        service = RecordingService()
+        notifier.add_service(service)
+        notifier.notify("hello")
+
+        assert notifier._services == [service]
+        assert RecordingService.sent == [("RecordingService", "hello")]
+
+    def test_remove_service(self):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Other])
+        notifier.remove_service(RecordingService)
+        notifier.notify("hello")
+
+        assert notifier.get_services() == ["Other"]
+        assert RecordingService.sent == [("Other", "hello")]
+
+    def test_remove_unknown_service(self):
+        notifier = Notifier()
+
+        with pytest.raises(ValueError, match="RecordingService"):
+            notifier.remove_service(RecordingService)
+
+    def test_remove_service_keeps_others_reachable(self):
+        class Second(RecordingService):
+            pass
+
+        class Third(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Second, Third])
+        notifier.remove_service(RecordingService)
+        notifier.remove_service(Third)
+
+        assert notifier.get_services() == ["Second"]
+        notifier.notify("hello")
+        assert RecordingService.sent == [("Second", "hello")]
+
+    def test_add_service_twice(self):
+        notifier = Notifier()
+        notifier.add_service(RecordingService)
+        notifier.add_service(RecordingService)
+        notifier.notify("hello")
+
+        assert notifier.get_services() == ["RecordingService", "RecordingService"]
+        assert RecordingService.sent == [("RecordingService", "hello")] * 2
+
+    def test_add_same_instance_twice(self):
+        notifier = Notifier()
+        service = RecordingService()
+        notifier.add_service(service)
+        notifier.add_service(service)
+
+        assert notifier._services == [service]
+
+    def test_remove_service_instance(self):
+        notifier = Notifier()
+        first, second = RecordingService(), RecordingService()
+        notifier.add_services([first, second])
+        notifier.remove_service(first)
+
+        assert notifier._services == [second]
+        with pytest.raises(ValueError, match="RecordingService"):
+            notifier.remove_service(first)
+
+    def test_remove_service_class_removes_all_instances(self):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Other, RecordingService()])
+        notifier.remove_service(RecordingService)
+
+        assert notifier.get_services() == ["Other"]
+        notifier.notify("hello")
+        assert RecordingService.sent == [("Other", "hello")]
+
+    def test_notify_logs_one_record_per_outcome(self, caplog):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Other, FailingService])
+
+        with caplog.at_level(logging.INFO, logger="fenn.notification.notifier"):
+            notifier.notify("hello")
+
+        assert [record.levelno for record in caplog.records] == [logging.INFO, logging.ERROR]
+        assert "2 services" in caplog.records[0].getMessage()
+        assert "FailingService" in caplog.records[1].getMessage()
+        assert "boom" in caplog.records[1].getMessage()
+
+    def test_service_without_send_notification_fails(self):
+        class Incomplete(Service):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([Incomplete, RecordingService])
+        notifier.notify("hello")
+
+        with pytest.raises(NotImplementedError):
+            Incomplete().send_notification("hello")
+        assert RecordingService.sent == [("RecordingService", "hello")]
+
+    def test_background_notify_returns_before_sending(self):
+        release = threading.Event()
+
+        class Slow(RecordingService):
+            def send_notification(self, message: str) -> None:
+                release.wait(timeout=5)
+                super().send_notification(message)
+
+        notifier = Notifier(background=True)
+        notifier.add_service(Slow)
+        notifier.notify("first")
+        notifier.notify("second")
+
+        assert RecordingService.sent == []
+        assert not notifier.flush(timeout=0.01)
+
+        release.set()
+
+        assert notifier.flush(timeout=5)
+        assert RecordingService.sent == [("Slow", "first"), ("Slow", "second")]
+
+    def test_flush_without_background(self):
+        assert Notifier().flush(timeout=0)
+
+    def test_service_management_is_logged_lazily(self, caplog):
+        notifier = Notifier()
+
+        with caplog.at_level(logging.DEBUG, logger="fenn.notification.notifier"):
+            notifier.add_service(RecordingService)
+            notifier.remove_service(RecordingService)
+
+        assert [record.args for record in caplog.records] == [
+            ("RecordingService",),
+            ("RecordingService",),
+        ]
+        assert caplog.records[0].getMessage() == "Added notification service: RecordingService"
+
+    def test_notify_many_keeps_order_per_service(self):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier()
+        notifier.add_services([RecordingService, Other])
+        notifier.notify_many(f"message {i}" for i in range(5))
+
+        for name in ("RecordingService", "Other"):
+            sent = [message for service, message in RecordingService.sent if service == name]
+            assert sent == [f"message {i}" for i in range(5)]
+
+    def test_notify_many_continues_after_failure(self):
+        class Flaky(RecordingService):
+            def send_notification(self, message: str) -> None:
+                if message == "bad":
+                    raise RuntimeError("boom")
+                super().send_notification(message)
+
+        notifier = Notifier()
+        notifier.add_services([Flaky, FailingService])
+        notifier.notify_many(["first", "bad", "last"])
+
+        assert RecordingService.sent == [("Flaky", "first"), ("Flaky", "last")]
+
+    def test_notify_many_in_background(self):
+        notifier = Notifier(background=True)
+        notifier.add_service(RecordingService)
+        notifier.notify_many(["first", "second"])
+
+        assert notifier.flush(timeout=5)
+        assert RecordingService.sent == [("RecordingService", "first"), ("RecordingService", "second")]
+
+    def test_close_sends_queued_messages_and_stops_worker(self):
+        closed = []
+
+        class Closing(RecordingService):
+            def close(self) -> None:
+                closed.append(self.__class__.__name__)
+
+        notifier = Notifier(background=True)
+        notifier.add_service(Closing)
+        notifier.notify("hello")
+
+        assert notifier.close(timeout=5)
+        assert not notifier._worker.is_alive()
+        assert RecordingService.sent == [("Closing", "hello")]
+        assert closed == ["Closing"]
+        assert notifier.get_services() == []
+        assert notifier._executor is None
+
+    def test_notify_after_close_sends_synchronously(self):
+        notifier = Notifier(background=True)
+        notifier.add_service(RecordingService)
+        assert notifier.close(timeout=5)
+
+        notifier.add_service(RecordingService)
+        notifier.notify("after close")
+
+        assert RecordingService.sent == [("RecordingService", "after close")]
+        assert notifier.flush(timeout=1)
+        notifier.close()
+
+    def test_messages_behind_stop_are_no_longer_pending(self):
+        notifier = Notifier()
+        notifier.add_service(RecordingService)
+        notifier._idle = threading.Condition()
+        notifier._pending = 2
+        jobs = queue.SimpleQueue()
+        for item in ["sent", _STOP, "dropped"]:
+            jobs.put(item)
+
+        _drain(weakref.ref(notifier), jobs)
+
+        assert notifier._pending == 0
+        assert RecordingService.sent == [("RecordingService", "sent")]
+        notifier.close()
+
+    def test_unused_background_notifier_is_collected(self):
+        notifiers = [Notifier(background=True) for _ in range(5)]
+        refs = [weakref.ref(notifier) for notifier in notifiers]
+        workers = [notifier._worker for notifier in notifiers]
+
+        del notifiers
+        gc.collect()
+
+        assert all(ref() is None for ref in refs)
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+
+    def test_background_notify_while_services_change(self, caplog):
+        class Other(RecordingService):
+            pass
+
+        notifier = Notifier(background=True)
+        notifier.add_service(RecordingService)
+
+        with caplog.at_level(logging.ERROR, logger="fenn.notification.notifier"):
+            for i in range(200):
+                notifier.notify(f"message {i}")
+                if i % 2:
+                    notifier.add_service(Other)
+                else:
+                    notifier.clear_services()
+                    notifier.add_service(RecordingService)
+            assert notifier.flush(timeout=5)
+
+        assert not [r for r in caplog.records if "background" in r.getMessage()]
+        notifier.close(timeout=5)
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from fenn.notification.services.resend import Resend
+import resend
+from fenn.notification.services.resend import Resend, _HTTP_CLIENT
 
 
 @pytest.fixture(scope="class")
@@ -135,4 +136,30 @@ class TestResend:
                 service.send_notification(message)
             
             assert "Resend API error" in str(exc_info.value)
-            assert "Rate limit exceeded" in str(exc_info.value)
\ No newline at end of file
+            assert "Rate limit exceeded" in str(exc_info.value)
+
+    def test_installs_persistent_http_client(self, mock_resend_config, monkeypatch, requests_mock):
+        """Test that Resend sends API calls through one reusable session."""
+        mock_resend_config()
+        monkeypatch.setattr(resend, "default_http_client", resend.RequestsClient())
+
+        Resend()
+        assert resend.default_http_client is _HTTP_CLIENT
+
+        requests_mock.post("https://api.resend.com/emails", status_code=200, json={"id": "abc"})
+        content, status_code, _ = _HTTP_CLIENT.request(
+            "post", "https://api.resend.com/emails", headers={}, json={"to": ["a@b.c"]}
+        )
+        assert status_code == 200
+        assert b"abc" in content
+        assert requests_mock.last_request.json() == {"to": ["a@b.c"]}
+
+    def test_keeps_user_http_client(self, mock_resend_config, monkeypatch):
+        """Test that a custom client installed by the user is left alone."""
+        mock_resend_config()
+        custom_client = Mock(spec=resend.HTTPClient)
+        monkeypatch.setattr(resend, "default_http_client", custom_client)
+
+        Resend()
+        assert resend.default_http_client is custom_client
+
@@ -0,0 +1,200 @@
+import asyncio
+import gc
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from fenn.notification import Notifier
+from fenn.notification.services._session import build_session
+from fenn.notification.services.discord import Discord
+from fenn.notification.services.slack import Slack
+
+
+@pytest.fixture
+def slow_server():
+    """Local webhook endpoint that counts POSTs and answers after a second."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            received.append(self.path)
+            time.sleep(1)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_timed_out_post_is_sent_once(slow_server):
+    base_url, received = slow_server
+    session = build_session(base_url)
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.post(f"{base_url}/hook", json={"text": "hello"}, timeout=0.3)
+
+    # Leave time for any re-sent request to reach the server
+    time.sleep(1.5)
+    session.close()
+
+    assert received == ["/hook"]
+
+
+@pytest.fixture
+def webhook_server():
+    """Local webhook endpoint answering with queued statuses, 200 once empty."""
+    received = []
+    statuses = []
+    headers = {"Retry-After": "0"}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append((self.path, self.rfile.read(int(self.headers["Content-Length"]))))
+            self.send_response(statuses.pop(0) if statuses else 200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", received, statuses, headers
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def aiohttp_enabled(monkeypatch):
+    """Make sure the aiohttp code path is taken, skipping without aiohttp."""
+    pytest.importorskip("aiohttp")
+    monkeypatch.setattr("fenn.notification.services.slack.AIOHTTP_AVAILABLE", True)
+    monkeypatch.setattr("fenn.notification.services.discord.AIOHTTP_AVAILABLE", True)
+
+
+def make_slack(base_url):
+    # Bypass __init__ to avoid KeyStore singleton
+    slack = object.__new__(Slack)
+    slack._slack_webhook_url = f"{base_url}/slack"
+    slack._session = build_session(base_url)
+    return slack
+
+
+def make_discord(base_url):
+    discord = object.__new__(Discord)
+    discord._discord_webhook_url = f"{base_url}/discord"
+    discord._session = build_session(base_url)
+    return discord
+
+
+def unclosed_warnings(caplog):
+    gc.collect()
+    return [record for record in caplog.records if "Unclosed" in record.getMessage()]
+
+
+def test_notify_async_closes_its_session(aiohttp_enabled, webhook_server, caplog):
+    base_url, received, _, _ = webhook_server
+    notifier = Notifier()
+    notifier.add_services([make_slack(base_url), make_discord(base_url)])
+
+    with caplog.at_level(logging.ERROR, logger="asyncio"):
+        for _ in range(3):
+            asyncio.run(notifier.notify_async("hello"))
+
+        assert not unclosed_warnings(caplog)
+    assert sorted(received) == sorted([
+        ("/slack", b'{"text":"hello"}'),
+        ("/discord", b'{"content":"hello","username":"fenn"}'),
+    ] * 3)
+    notifier.close()
+
+
+def test_send_notification_async_closes_its_session(aiohttp_enabled, webhook_server, caplog):
+    base_url, received, _, _ = webhook_server
+    slack = make_slack(base_url)
+
+    with caplog.at_level(logging.ERROR, logger="asyncio"):
+        asyncio.run(slack.send_notification_async("one"))
+        asyncio.run(slack.send_notification_async("two"))
+
+        assert not unclosed_warnings(caplog)
+    assert received == [("/slack", b'{"text":"one"}'), ("/slack", b'{"text":"two"}')]
+    slack.close()
+
+
+def test_async_send_retries_rate_limits(aiohttp_enabled, webhook_server):
+    base_url, received, statuses, _ = webhook_server
+    statuses.extend([429, 503])
+    slack = make_slack(base_url)
+
+    asyncio.run(slack.send_notification_async("hello"))
+
+    assert len(received) == 3
+    slack.close()
+
+
+def test_async_send_error_is_request_exception(aiohttp_enabled, webhook_server):
+    base_url, received, statuses, _ = webhook_server
+    statuses.append(400)
+    slack = make_slack(base_url)
+
+    with pytest.raises(requests.exceptions.RequestException, match="Failed to send Slack notification"):
+        asyncio.run(slack.send_notification_async("hello"))
+    assert len(received) == 1
+    slack.close()
+
+
+def test_long_retry_after_fails_at_once(webhook_server):
+    base_url, received, statuses, headers = webhook_server
+    statuses.append(429)
+    headers["Retry-After"] = "3600"
+    slack = make_slack(base_url)
+
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.RequestException, match="429"):
+        slack.send_notification("hello")
+
+    assert time.monotonic() - started < 5
+    assert len(received) == 1
+    slack.close()
+
+
+def test_async_long_retry_after_fails_at_once(aiohttp_enabled, webhook_server):
+    base_url, received, statuses, headers = webhook_server
+    statuses.append(429)
+    headers["Retry-After"] = "3600"
+    slack = make_slack(base_url)
+
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.RequestException, match="429"):
+        asyncio.run(slack.send_notification_async("hello"))
+
+    assert time.monotonic() - started < 5
+    assert len(received) == 1
+    slack.close()
+
+
+def test_send_retries_rate_limits(webhook_server):
+    base_url, received, statuses, _ = webhook_server
+    statuses.extend([429, 503])
+    slack = make_slack(base_url)
+
+    slack.send_notification("hello")
+
+    assert len(received) == 3
+    slack.close()
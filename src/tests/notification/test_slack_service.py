@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 import requests
@@ -11,14 +11,29 @@ def test_slack_message():
     # Bypass __init__ to avoid KeyStore singleton
     slack = object.__new__(Slack)
     slack._slack_webhook_url = "https://slack.test"
+    slack._session = Mock()
 
-    with patch("requests.post") as mock_post:
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    slack._session.post.return_value = mock_response
 
-        slack.send_notification("hello test")
+    slack.send_notification("hello test")
 
-        mock_post.assert_called_once_with(
-            "https://slack.test", json={"text": "hello test"}, timeout=10
-        )
+    slack._session.post.assert_called_once_with(
+        "https://slack.test",
+        data=b'{"text":"hello test"}',
+        headers={"Content-Type": "application/json"},
+        timeout=10,
+    )
+
+
+def test_slack_message_without_orjson(monkeypatch):
+    """Test that the stdlib JSON fallback encodes the same body"""
+    monkeypatch.setattr("fenn.notification.services._session.ORJSON_AVAILABLE", False)
+    slack = object.__new__(Slack)
+    slack._slack_webhook_url = "https://slack.test"
+    slack._session = Mock()
+
+    slack.send_notification("hello test")
+
+    assert slack._session.post.call_args.kwargs["data"] == b'{"text":"hello test"}'
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 
+import fenn.vision.color_mode as color_mode
 from fenn.vision.color_mode import ensure_color_mode
 
 
@@ -31,6 +32,19 @@ class TestEnsureColorMode:
         np.testing.assert_array_equal(rgb[:, 1, :, :], gray[:, 0, :, :])
         np.testing.assert_array_equal(rgb[:, 2, :, :], gray[:, 0, :, :])
 
+    def test_gray_to_rgb_is_read_only_view(self):
+        """Test that GRAY → RGB shares the input buffer unless copy is requested."""
+        gray = np.random.randint(0, 255, (10, 224, 224), dtype=np.uint8)
+        rgb = ensure_color_mode(gray, mode="RGB")
+
+        assert np.shares_memory(rgb, gray)
+        assert not rgb.flags.writeable
+
+        rgb_copy = ensure_color_mode(gray, mode="RGB", copy=True)
+        assert not np.shares_memory(rgb_copy, gray)
+        assert rgb_copy.flags.writeable and rgb_copy.flags.c_contiguous
+        np.testing.assert_array_equal(rgb_copy, rgb)
+
     def test_gray_to_rgba_channels_last(self):
         """Test GRAY → RGBA conversion with channels last."""
         gray = np.random.randint(0, 255, (10, 224, 224), dtype=np.uint8)
@@ -45,6 +59,21 @@ class TestEnsureColorMode:
         # Alpha should be 255 (full opacity for uint8)
         assert np.all(rgba[:, :, :, 3] == 255)
 
+    def test_gray_to_rgba_with_channel_dimension(self):
+        """Test GRAY → RGBA keeps an explicit channel dimension in place."""
+        gray = np.random.rand(4, 32, 32).astype(np.float32)
+
+        rgba_last = ensure_color_mode(gray[..., np.newaxis], mode="RGBA")
+        rgba_first = ensure_color_mode(gray[:, np.newaxis], mode="RGBA")
+
+        assert rgba_last.shape == (4, 32, 32, 4)
+        assert rgba_first.shape == (4, 4, 32, 32)
+        for channel in range(3):
+            np.testing.assert_array_equal(rgba_last[..., channel], gray)
+            np.testing.assert_array_equal(rgba_first[:, channel], gray)
+        assert np.all(rgba_last[..., 3] == 1.0)
+        assert np.all(rgba_first[:, 3] == 1.0)
+
     def test_rgb_to_gray_channels_last(self):
         """Test RGB → GRAY conversion with channels last."""
         rgb = np.random.randint(0, 255, (10, 224, 224, 3), dtype=np.uint8)
@@ -56,6 +85,72 @@ class TestEnsureColorMode:
         expected = (rgb[:, :, :, 0] * 0.299 + rgb[:, :, :, 1] * 0.587 + rgb[:, :, :, 2] * 0.114).astype(np.uint8)
         np.testing.assert_array_almost_equal(gray, expected, decimal=0)
 
+    def test_rgb_to_gray_numpy_fallback(self, monkeypatch):
+        """Test that the NumPy kernel is bit-exact with the default (OpenCV if installed) path."""
+        # Every 8-bit RGB color once, as a batch of 256 images of 256x256
+        values = np.arange(1 << 24, dtype=np.uint32)
+        rgb = np.stack([values >> 16, values >> 8, values], axis=-1).astype(np.uint8)
+        rgb = rgb.reshape(256, 256, 256, 3)
+        gray = ensure_color_mode(rgb, mode="GRAY")
+
+        monkeypatch.setattr(color_mode, "CV2_AVAILABLE", False)
+        gray_numpy = ensure_color_mode(rgb, mode="GRAY")
+
+        assert gray_numpy.dtype == gray.dtype
+        np.testing.assert_array_equal(gray_numpy, gray)
+
+    def test_rgb_to_gray_same_for_either_layout(self):
+        """Test that channels first and channels last give the same uint8 pixels."""
+        rgba = np.random.randint(0, 256, (4, 64, 64, 4), dtype=np.uint8)
+        gray_last = ensure_color_mode(rgba, mode="GRAY")
+        gray_first = ensure_color_mode(np.ascontiguousarray(rgba.transpose(0, 3, 1, 2)), mode="GRAY")
+
+        np.testing.assert_array_equal(gray_first, gray_last)
+
+    def test_rgb_to_gray_parallel_batches(self, monkeypatch):
+        """Test that splitting the batch over threads gives the same result."""
+        monkeypatch.setattr(color_mode, "CV2_AVAILABLE", False)
+        rgba = np.random.randint(0, 255, (7, 32, 32, 4), dtype=np.uint8)
+        serial = ensure_color_mode(rgba, mode="GRAY")
+
+        monkeypatch.setattr(color_mode, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(color_mode, "GRAY_WORKERS", 3)
+        parallel = ensure_color_mode(rgba, mode="GRAY")
+
+        assert parallel.shape == (7, 32, 32)
+        np.testing.assert_array_equal(parallel, serial)
+
+    def test_rgb_to_gray_non_contiguous(self, monkeypatch):
+        """Test that strided inputs convert like their contiguous copies."""
+        monkeypatch.setattr(color_mode, "CV2_AVAILABLE", False)
+        for dtype in (np.uint8, np.float32):
+            rgba = (np.random.rand(4, 16, 16, 4) * 255).astype(dtype)
+            views = [
+                rgba[..., :3],                          # channel slice, channels last
+                rgba.transpose(0, 3, 2, 1)[:, :3],      # transposed, channels first
+            ]
+            for view in views:
+                assert not view.flags.c_contiguous
+                # Float sums may differ in the last bit with the summation order
+                np.testing.assert_allclose(
+                    ensure_color_mode(view, mode="GRAY"),
+                    ensure_color_mode(np.ascontiguousarray(view), mode="GRAY"),
+                    rtol=1e-6,
+                )
+
+    def test_rgb_to_gray_numpy_rounding(self, monkeypatch):
+        """Test that the NumPy uint8 kernel rounds to the nearest gray level."""
+        monkeypatch.setattr(color_mode, "CV2_AVAILABLE", False)
+        rgb = np.zeros((1, 2, 3, 3), dtype=np.uint8)
+        rgb[0, 0, 0] = [255, 0, 0]
+        rgb[0, 0, 1] = [0, 255, 0]
+        rgb[0, 0, 2] = [0, 0, 255]
+
+        gray = ensure_color_mode(rgb, mode="GRAY")
+
+        # 0.299 * 255 = 76.2, 0.587 * 255 = 149.7, 0.114 * 255 = 29.1
+        np.testing.assert_array_equal(gray[0, 0], [76, 150, 29])
+
     def test_rgb_to_gray_channels_first(self):
         """Test RGB → GRAY conversion with channels first."""
         rgb = np.random.randint(0, 255, (10, 3, 224, 224), dtype=np.uint8)
@@ -64,6 +159,16 @@ class TestEnsureColorMode:
         assert gray.shape == (10, 224, 224)
         assert gray.dtype == rgb.dtype
 
+    def test_rgb_to_gray_float_channels_first(self):
+        """Test RGB → GRAY values for float input with channels first."""
+        rgb = np.random.rand(10, 3, 32, 32).astype(np.float32)
+        gray = ensure_color_mode(rgb, mode="GRAY")
+
+        assert gray.shape == (10, 32, 32)
+        assert gray.dtype == rgb.dtype
+        expected = rgb[:, 0] * 0.299 + rgb[:, 1] * 0.587 + rgb[:, 2] * 0.114
+        np.testing.assert_allclose(gray, expected, rtol=1e-5)
+
     def test_rgb_to_rgba_channels_last(self):
         """Test RGB → RGBA conversion with channels last."""
         rgb = np.random.randint(0, 255, (10, 224, 224, 3), dtype=np.uint8)
@@ -98,19 +203,77 @@ class TestEnsureColorMode:
         expected = (rgb[:, :, :, 0] * 0.299 + rgb[:, :, :, 1] * 0.587 + rgb[:, :, :, 2] * 0.114).astype(np.uint8)
         np.testing.assert_array_almost_equal(gray, expected, decimal=0)
 
+    def test_rgba_to_gray_channels_first(self):
+        """Test RGBA → GRAY conversion with channels first ignores alpha."""
+        rgba = np.random.randint(0, 255, (10, 4, 32, 32), dtype=np.uint8)
+        gray = ensure_color_mode(rgba, mode="GRAY")
+
+        assert gray.shape == (10, 32, 32)
+        assert gray.dtype == rgba.dtype
+        expected = ensure_color_mode(np.ascontiguousarray(rgba[:, :3]), mode="GRAY")
+        np.testing.assert_array_equal(gray, expected)
+
+    def test_float_rgba_to_gray_ignores_non_finite_alpha(self):
+        """Test that a NaN or inf alpha does not reach the gray values."""
+        rgba = np.random.rand(2, 8, 8, 4).astype(np.float32)
+        rgba[..., 3] = np.nan
+        rgba[0, ..., 3] = np.inf
+        expected = ensure_color_mode(np.ascontiguousarray(rgba[..., :3]), mode="GRAY")
+
+        gray_last = ensure_color_mode(rgba, mode="GRAY")
+        gray_first = ensure_color_mode(np.ascontiguousarray(rgba.transpose(0, 3, 1, 2)), mode="GRAY")
+
+        assert np.isfinite(gray_last).all()
+        np.testing.assert_allclose(gray_last, expected, rtol=1e-6)
+        np.testing.assert_allclose(gray_first, expected, rtol=1e-6)
+
     def test_no_op_rgb(self):
-        """Test that RGB → RGB returns a copy."""
+        """Test that RGB → RGB returns a new array object."""
         rgb = np.random.randint(0, 255, (10, 224, 224, 3), dtype=np.uint8)
         result = ensure_color_mode(rgb, mode="RGB")
         
         assert result.shape == rgb.shape
         assert result.dtype == rgb.dtype
         np.testing.assert_array_equal(result, rgb)
-        # Should be a copy, not the same array
+        # Should be a new array object, not the same array
         assert result is not rgb
 
+    def test_no_op_shares_memory_unless_copy(self):
+        """Test that a no-op conversion only copies when asked to, and copy=True always does."""
+        rgb = np.random.randint(0, 255, (10, 224, 224, 3), dtype=np.uint8)
+
+        view = ensure_color_mode(rgb, mode="RGB")
+        assert np.shares_memory(view, rgb)
+        assert not view.flags.writeable
+        assert rgb.flags.writeable
+
+        result = ensure_color_mode(rgb, mode="RGB", copy=True)
+        assert not np.shares_memory(result, rgb)
+        assert result.flags.writeable
+        np.testing.assert_array_equal(result, rgb)
+
+        # copy=True holds for every conversion, not only the no-op
+        inputs = {
+            "GRAY": np.random.randint(0, 255, (2, 16, 16), dtype=np.uint8),
+            "RGB": np.random.randint(0, 255, (2, 16, 16, 3), dtype=np.uint8),
+            "RGBA": np.random.randint(0, 255, (2, 16, 16, 4), dtype=np.uint8),
+        }
+        inputs["RGB first"] = np.moveaxis(inputs["RGB"], -1, 1).copy()
+        inputs["RGBA first"] = np.moveaxis(inputs["RGBA"], -1, 1).copy()
+
+        for name, array in inputs.items():
+            for mode in ("GRAY", "RGB", "RGBA"):
+                result = ensure_color_mode(array, mode=mode, copy=True)
+                assert not np.shares_memory(result, array), (name, mode)
+                assert result.flags.writeable, (name, mode)
+
+                # Without a copy, results sharing the input's memory are read-only
+                result = ensure_color_mode(array, mode=mode)
+                if np.shares_memory(result, array):
+                    assert not result.flags.writeable, (name, mode)
+
     def test_no_op_rgba(self):
-        """Test that RGBA → RGBA returns a copy."""
+        """Test that RGBA → RGBA returns a new array object."""
         rgba = np.random.randint(0, 255, (10, 224, 224, 4), dtype=np.uint8)
         result = ensure_color_mode(rgba, mode="RGBA")
         
@@ -120,7 +283,7 @@ class TestEnsureColorMode:
         assert result is not rgba
 
     def test_no_op_gray(self):
-        """Test that GRAY → GRAY returns a copy."""
+        """Test that GRAY → GRAY returns a new array object."""
         gray = np.random.randint(0, 255, (10, 224, 224), dtype=np.uint8)
         result = ensure_color_mode(gray, mode="GRAY")
         
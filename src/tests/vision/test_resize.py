@@ -105,3 +105,45 @@ class TestResizeBatch:
         array_cl = np.random.randint(0, 255, (1, 100, 100, 3), dtype=np.uint8)
         result_cl = resize_batch(array_cl, size=(50, 50))
         assert result_cl.shape == (1, 50, 50, 3)  # Still channels last
+
+    def test_same_size_does_not_alias_input(self):
+        """Test that resizing to the input size still returns a new array."""
+        array = np.random.randint(0, 255, (2, 3, 50, 50), dtype=np.uint8)
+        result = resize_batch(array, size=(50, 50))
+
+        np.testing.assert_array_equal(result, array)
+        assert not np.shares_memory(result, array)
+
+    def test_read_only_input(self):
+        """Test resize of a read-only broadcast view (e.g. from ensure_color_mode)."""
+        gray = np.random.randint(0, 255, (2, 100, 100, 1), dtype=np.uint8)
+        array = np.broadcast_to(gray, (2, 100, 100, 3))
+        result = resize_batch(array, size=(50, 50))
+
+        assert result.shape == (2, 50, 50, 3)
+        assert result.dtype == np.uint8
+
+    def test_flipped_input(self):
+        """Test resize of views with negative strides, e.g. flipped images."""
+        uint8_array = np.random.randint(0, 255, (2, 100, 100, 3), dtype=np.uint8)
+        float_array = np.random.rand(2, 100, 100, 3).astype(np.float32)
+
+        for array in (uint8_array, float_array):
+            flipped = array[:, :, ::-1]
+            result = resize_batch(flipped, size=(50, 50))
+
+            assert result.shape == (2, 50, 50, 3)
+            assert result.dtype == array.dtype
+            np.testing.assert_array_equal(
+                result, resize_batch(np.ascontiguousarray(flipped), size=(50, 50))
+            )
+
+    def test_explicit_cpu_device(self):
+        """Test that an explicit device is honoured and output stays NumPy."""
+        array = np.random.randint(0, 65535, (2, 100, 100), dtype=np.uint16)
+        result = resize_batch(array, size=(50, 50), device="cpu")
+
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (2, 50, 50)
+        assert result.dtype == np.uint16
+